@@ -1,11 +1,14 @@
 from database.mongodb import MongoDB
 from utils.http_client_manager import get_http_client
 from datetime import datetime
-import os, jwt, logging
+import asyncio, os, jwt, logging
 
 logger = logging.getLogger(__name__)
 
 class GFATokenManager:
+    # 같은 토큰을 쓰는 작업이 동시에 갱신하면 서로의 토큰을 무효화하므로 프로세스 단위로 확인 / 갱신을 직렬화
+    _refresh_lock = asyncio.Lock()
+
     def __init__(self):
         self.jwt_token = os.environ["jwt_token_key"]
         self.client_id = os.environ["GFA_CLIENT_ID"]
@@ -18,7 +21,7 @@ class GFATokenManager:
     
     async def _get_token_info(self):
         db = await self._get_db()
-        gfa_token = db.get_collection("token").find_one({"media": "gfa"})
+        gfa_token = await asyncio.to_thread(db.get_collection("token").find_one, {"media": "gfa"})
         if not gfa_token:
             raise Exception("토큰이 데이터베이스에 없습니다.")
         
@@ -34,19 +37,20 @@ class GFATokenManager:
         return {"access_token": access_token, "refresh_token": refresh_token}
     
     async def get_vaild_token(self):
-        token_info = await self._get_token_info()
-        access_token, refresh_token = (
-            token_info["access_token"],
-            token_info["refresh_token"],
-        )
+        async with GFATokenManager._refresh_lock:
+            token_info = await self._get_token_info()
+            access_token, refresh_token = (
+                token_info["access_token"],
+                token_info["refresh_token"],
+            )
         
-        check_token_result = await self._validate_token(access_token)
+            check_token_result = await self._validate_token(access_token)
         
-        if check_token_result is False:
-            new_access_token = await self._refresh_access_token(refresh_token)
-            return new_access_token
+            if check_token_result is False:
+                new_access_token = await self._refresh_access_token(refresh_token)
+                return new_access_token
         
-        return access_token
+            return access_token
 
     async def _validate_token(self, access_token):
         """토큰 유효성 검사"""
@@ -92,7 +96,8 @@ class GFATokenManager:
             encode_token = jwt.encode(token, self.jwt_token, algorithm="HS256")
 
             db = await self._get_db()
-            db.get_collection("token").update_one(
+            await asyncio.to_thread(
+                db.get_collection("token").update_one,
                 {"media": "gfa"}, {"$set": {"token": encode_token }}, upsert=True
             )
             logger.info("Access Token이 성공적으로 갱신되었습니다")
@@ -126,7 +131,8 @@ class GFATokenManager:
                 encode_token = jwt.encode(token, self.jwt_token, algorithm="HS256")
 
                 db = await self._get_db()
-                db.get_collection("token").update_one(
+                await asyncio.to_thread(
+                    db.get_collection("token").update_one,
                     {"media": "gfa"}, {"$set": {
                         "token": encode_token,
                         "updated_at": datetime.now()
@@ -1,12 +1,15 @@
 from database.mongodb import MongoDB
 from utils.http_client_manager import get_http_client
 from datetime import datetime
-import os, jwt, logging
+import asyncio, os, jwt, logging
 
 logger = logging.getLogger(__name__)
 
 
 class KakaoTokenManager:
+    # 같은 토큰을 쓰는 작업이 동시에 갱신하면 서로의 토큰을 무효화하므로 프로세스 단위로 확인 / 갱신을 직렬화
+    _refresh_lock = asyncio.Lock()
+
     def __init__(self):
         self.jwt_token = os.environ["jwt_token_key"]
         self.client_id = os.environ["KAKAO_CLIENT_ID"]
@@ -40,7 +43,8 @@ class KakaoTokenManager:
             encode_token = jwt.encode(token, self.jwt_token, algorithm="HS256")
 
             db = await self._get_db()
-            db.get_collection("token").update_one(
+            await asyncio.to_thread(
+                db.get_collection("token").update_one,
                 {"media": "kakao"}, {"$set": {"token": encode_token}}, upsert=True
             )
             return True
@@ -49,24 +53,25 @@ class KakaoTokenManager:
             raise Exception(f"토큰 갱신 실패: {str(e)}")
 
     async def get_vaild_token(self):
-        token_info = await self._get_token_info()
-        access_token, refresh_token = (
-            token_info["access_token"],
-            token_info["refresh_token"],
-        )
+        async with KakaoTokenManager._refresh_lock:
+            token_info = await self._get_token_info()
+            access_token, refresh_token = (
+                token_info["access_token"],
+                token_info["refresh_token"],
+            )
 
-        check_token_result = await self._check_access_token(access_token)
+            check_token_result = await self._check_access_token(access_token)
 
-        if check_token_result is False:
-            new_access_token = await self._refresh_access_token(refresh_token)
-            return new_access_token
+            if check_token_result is False:
+                new_access_token = await self._refresh_access_token(refresh_token)
+                return new_access_token
 
-        return access_token
+            return access_token
 
     async def _get_token_info(self):
         try:
             db = await self._get_db()
-            kakao_token = db.get_collection("token").find_one({"media": "kakao"})
+            kakao_token = await asyncio.to_thread(db.get_collection("token").find_one, {"media": "kakao"})
             if not kakao_token:
                 raise Exception("토큰이 데이터베이스에 없습니다.")
 
@@ -141,7 +146,8 @@ class KakaoTokenManager:
                 )
 
                 db = await self._get_db()
-                db.get_collection("token").update_one(
+                await asyncio.to_thread(
+                    db.get_collection("token").update_one,
                     {"media": "kakao"}, {"$set": {
                         "token": encode_new_token,
                         "updated_at": datetime.now()
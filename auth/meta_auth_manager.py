@@ -1,9 +1,15 @@
 from clients.meta_ads_api_client import MetaAdsAPIClient
+from clients.meta_graph_batcher import MetaGraphBatcher
 import os
 
 
-def get_meta_ads_client(account_id):
-    """Meta Ads 클라이언트 생성"""
+def get_meta_graph_batcher():
+    """여러 광고 계정 클라이언트가 함께 사용할 Graph API 배치 처리기 생성"""
+    return MetaGraphBatcher(os.environ["META_ACCESS_TOKEN"])
+
+
+def get_meta_ads_client(account_id, batcher=None):
+    """Meta Ads 클라이언트 생성 (batcher 지정 시 요청을 배치로 전송)"""
     config = {
         "access_token": os.environ["META_ACCESS_TOKEN"],
         "app_id": os.environ["META_APP_ID"],
@@ -15,4 +21,4 @@ def get_meta_ads_client(account_id):
         if not value:
             raise ValueError(f"{key.upper()} 환경 변수가 설정되지 않았습니다.")
 
-    return MetaAdsAPIClient(**config, account_id=account_id)
+    return MetaAdsAPIClient(**config, account_id=account_id, batcher=batcher)
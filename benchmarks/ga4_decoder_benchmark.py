@@ -0,0 +1,93 @@
+"""
+GA4ReportServices 응답 변환 벤치마크 (합성 RunReportResponse)
+
+기존 방식(행마다 proto-plus 순회 + dict 생성 + DataFrame 왕복)과 GA4ReportDecoder 비교
+실행: python -m benchmarks.ga4_decoder_benchmark [행 수]
+"""
+from google.analytics.data_v1beta.types import MetricType, RunReportResponse
+from services.ga4_report_decoder import GA4ReportDecoder
+import numpy as np
+import pandas as pd
+import random, sys, time
+
+DIMENSIONS = ["date", "sessionSource", "sessionMedium", "eventName"]
+METRICS = [
+    ("activeUsers", MetricType.TYPE_INTEGER),
+    ("sessions", MetricType.TYPE_INTEGER),
+    ("eventCount", MetricType.TYPE_INTEGER),
+    ("keyEvents", MetricType.TYPE_FLOAT),
+]
+
+
+def build_response(rows: int) -> RunReportResponse:
+    rng = random.Random(0)
+    pb = RunReportResponse.pb()()
+
+    for name in DIMENSIONS:
+        pb.dimension_headers.add(name=name)
+    for name, metric_type in METRICS:
+        pb.metric_headers.add(name=name, type_=metric_type)
+
+    for i in range(rows):
+        row = pb.rows.add()
+        for value in (f"202601{i % 30 + 1:02d}", f"source {i % 200}", f"medium {i % 20}", f"event {i % 15}"):
+            row.dimension_values.add(value=value)
+        for value in (rng.randint(0, 1000), rng.randint(0, 1000), rng.randint(0, 10000)):
+            row.metric_values.add(value=str(value))
+        row.metric_values.add(value=str(rng.randint(0, 50) / 2))
+
+    return RunReportResponse.wrap(pb)
+
+
+def legacy_convert(response, dimensions: list, metrics: list) -> list:
+    """기존 create_report 변환 방식"""
+    data = []
+    for rows in response.rows:
+        result = {}
+        for row, header in zip(rows.dimension_values, dimensions):
+            result[header] = row.value
+
+        for row, metric in zip(rows.metric_values, metrics):
+            if "keyEvents" in metrics:
+                result[metric] = float(row.value)
+
+            else:
+                result[metric] = int(row.value)
+
+        data.append(result)
+
+    data_df = pd.DataFrame(data)
+    data_df["date"] = pd.to_datetime(data_df["date"], format="%Y%m%d").dt.strftime(
+        "%Y-%m-%d"
+    )
+    return data_df.to_dict("records")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    metrics = [name for name, _ in METRICS]
+
+    response = build_response(rows)
+    print(f"report rows: {rows:,}")
+
+    started = time.perf_counter()
+    legacy = legacy_convert(response, DIMENSIONS, metrics)
+    print(f"legacy per-row loop: {time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    decoded = GA4ReportDecoder().decode(response)
+    print(f"columnar decoder: {time.perf_counter() - started:.2f}s")
+
+    # 기존 방식은 keyEvents가 있으면 모든 측정항목을 float로 변환하므로 값만 비교
+    expected = pd.DataFrame(legacy)
+    assert list(decoded.columns) == list(expected.columns)
+    for column in DIMENSIONS:
+        assert np.array_equal(decoded[column].to_numpy(), expected[column].to_numpy())
+    for column in metrics:
+        assert np.allclose(decoded[column].to_numpy(), expected[column].to_numpy())
+    print("results match")
+    print(f"dtypes: {dict(decoded.dtypes.astype(str))}")
+
+
+if __name__ == "__main__":
+    main()
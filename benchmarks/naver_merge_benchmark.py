@@ -0,0 +1,102 @@
+"""
+NaverReportService 통계 리포트 조인 벤치마크 (합성 AD 리포트)
+
+기존 방식(마스터별 pd.merge + 전체 fillna)과 NaverDimensionJoiner 비교
+실행: python -m benchmarks.naver_merge_benchmark [행 수]
+"""
+from configs.naver_config import naver_master_config, naver_vaild_fields
+from services.naver_dimension_joiner import NaverDimensionJoiner
+from utils.date_format import format_report_date
+import numpy as np
+import pandas as pd
+import sys, time
+
+
+def build_masters(campaigns: int, adgroups: int, keywords: int) -> dict:
+    return {
+        "Campaign": pd.DataFrame({
+            "campaignID": [f"cmp-{i}" for i in range(campaigns)],
+            "campaignName": [f"campaign {i}" for i in range(campaigns)],
+        }),
+        "Adgroup": pd.DataFrame({
+            "adGroupID": [f"grp-{i}" for i in range(adgroups)],
+            "adGroupName": [f"group {i}" for i in range(adgroups)],
+        }),
+        "Keyword": pd.DataFrame({
+            "adKeywordID": [f"nkw-{i}" for i in range(keywords)],
+            "adKeyword": [f"keyword {i}" for i in range(keywords)],
+        }),
+    }
+
+
+def build_ad_report(rows: int, campaigns: int, adgroups: int, keywords: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    # 일부 ID는 마스터에 없는 값으로 생성 (매칭 실패 -> "-")
+    campaign_ids = np.array([f"cmp-{i}" for i in range(campaigns + 10)], dtype=object)
+    adgroup_ids = np.array([f"grp-{i}" for i in range(adgroups + 100)], dtype=object)
+    keyword_ids = np.array([f"nkw-{i}" for i in range(keywords + 1000)], dtype=object)
+
+    return pd.DataFrame({
+        "date": np.full(rows, 20260101),
+        "customerID": np.full(rows, 1234567),
+        "campaignID": campaign_ids.take(rng.integers(0, len(campaign_ids), rows)),
+        "adGroupID": adgroup_ids.take(rng.integers(0, len(adgroup_ids), rows)),
+        "adKeywordID": keyword_ids.take(rng.integers(0, len(keyword_ids), rows)),
+        "adID": np.full(rows, "nad-1", dtype=object),
+        "businessChannelID": np.full(rows, "bsn-1", dtype=object),
+        "mediacode": rng.integers(0, 100, rows),
+        "pcMobileType": np.where(rng.random(rows) > 0.5, "P", "M").astype(object),
+        "impressions": rng.integers(0, 1000, rows),
+        "clicks": rng.integers(0, 100, rows),
+        "cost": rng.random(rows) * 1000,
+        "sumofADrank": rng.random(rows) * 10,
+        "viewcount": rng.integers(0, 10, rows),
+    })
+
+
+def legacy_join(report: pd.DataFrame, masters: dict, basics: list, valid_header: list) -> pd.DataFrame:
+    """기존 _merge_reports 방식"""
+    for basic in basics:
+        config_data = naver_master_config[basic]
+        id, name = config_data["id"], config_data["name"]
+        master = masters[basic].dropna(subset=name).set_index(id)[name]
+        report = pd.merge(report, master, on=id, how="left").fillna("-")
+
+    report["date"] = pd.to_datetime(report["date"], format="%Y%m%d").dt.strftime("%Y-%m-%d")
+    return report[valid_header]
+
+
+def engine_join(report: pd.DataFrame, masters: dict, basics: list, valid_header: list) -> pd.DataFrame:
+    joiner = NaverDimensionJoiner(masters)
+    result = joiner.join(report, basics, valid_header)
+    result["date"] = format_report_date(result["date"])
+    return result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    campaigns, adgroups, keywords = 200, 20_000, 500_000
+
+    masters = build_masters(campaigns, adgroups, keywords)
+    report = build_ad_report(rows, campaigns, adgroups, keywords)
+    basics = ["Campaign", "Adgroup", "Keyword"]
+    valid_header = naver_vaild_fields["AD"]
+    print(f"AD report rows: {rows:,}")
+
+    started = time.perf_counter()
+    legacy = legacy_join(report, masters, basics, valid_header)
+    print(f"legacy pd.merge: {time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    engine = engine_join(report, masters, basics, valid_header)
+    print(f"dimension joiner: {time.perf_counter() - started:.2f}s")
+
+    # 결과 일치 / dtype 확인 (legacy는 fillna로 숫자 컬럼도 object가 될 수 있음)
+    for field in valid_header:
+        assert (legacy[field].astype(str).to_numpy() == engine[field].astype(str).to_numpy()).all(), field
+    print("results match")
+    print(engine.dtypes.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from google.cloud import bigquery
 from utils.bigquery_client_manager import get_bigquery_client
-import logging, time, io
+from datetime import datetime, timedelta, timezone
+import asyncio, logging, io, uuid
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,11 @@ class BigQueryClient:
             self._client = await get_bigquery_client(self.config)
         return self._client
 
+    async def _run_query(self, query):
+        """쿼리 실행 후 완료까지 대기 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        client = await self._get_client()
+        return await asyncio.to_thread(lambda: client.query(query).result())
+
     async def create_dataset(self, dataset_id, location="US"):
         client = await self._get_client()
         dataset_ref = client.dataset(dataset_id)
@@ -72,7 +78,7 @@ class BigQueryClient:
         try:
             client = await self._get_client()
             table_ref = client.dataset(dataset_id).table(table_id)
-            table = client.get_table(table_ref)
+            table = await asyncio.to_thread(client.get_table, table_ref)
             return table.schema
         
         except Exception as e:
@@ -115,14 +121,14 @@ class BigQueryClient:
         table = bigquery.Table(table_ref, schema=schema)
 
         try:
-            table = client.create_table(table)
+            table = await asyncio.to_thread(client.create_table, table)
             logger.info(f"Created table {dataset_id}.{table_id}")
             return table
 
         except Exception as e:
             if "Already Exists" in str(e):
                 logger.info(f"Table {dataset_id}.{table_id} already exists")
-                return client.get_table(table_ref)
+                return await asyncio.to_thread(client.get_table, table_ref)
             else:
                 raise e
 
@@ -131,7 +137,7 @@ class BigQueryClient:
         try:
             client = await self._get_client()
             table_ref = client.dataset(dataset_id).table(table_id)
-            client.get_table(table_ref)
+            await asyncio.to_thread(client.get_table, table_ref)
             return True
 
         except Exception:
@@ -150,8 +156,7 @@ class BigQueryClient:
             WHERE {date_field} = DATE('{insert_date}')
             """
 
-            query_job = client.query(query)
-            results = query_job.result()
+            results = await self._run_query(query)
 
             for row in results:
                 return row.count > 0
@@ -176,8 +181,7 @@ class BigQueryClient:
             """
 
             logger.info(f"Deleting data for date {delete_date} from {dataset_id}.{table_id}")
-            query_job = client.query(query)
-            query_job.result()  # 쿼리 완료 대기
+            await self._run_query(query)  # 쿼리 완료 대기
 
             logger.info(f"Successfully deleted data for date {delete_date}")
             return True
@@ -200,8 +204,7 @@ class BigQueryClient:
             """
 
             logger.info(f"Deleting data from {start_date} to {end_date} from {dataset_id}.{table_id}")
-            query_job = client.query(query)
-            query_job.result()  # 쿼리 완료 대기
+            await self._run_query(query)  # 쿼리 완료 대기
 
             logger.info(f"Successfully deleted data from {start_date} to {end_date}")
             return True
@@ -210,6 +213,33 @@ class BigQueryClient:
             logger.error(f"Failed to delete data for date range {start_date} - {end_date}: {str(e)}")
             raise Exception(f"BigQuery 날짜 범위 데이터 삭제 실패: {str(e)}")
 
+    async def delete_data_by_dates(self, dataset_id, table_id, dates, date_field="date"):
+        """지정한 날짜들의 데이터만 삭제 (일 단위 교체용)"""
+        if not dates:
+            return True
+
+        if not await self._table_exists(dataset_id, table_id):
+            logger.info(f"Table {dataset_id}.{table_id} does not exist, skip deletion")
+            return True
+
+        try:
+            client = await self._get_client()
+            date_list = ", ".join(f"DATE('{date}')" for date in sorted(dates))
+            query = f"""
+            DELETE FROM `{client.project}.{dataset_id}.{table_id}`
+            WHERE {date_field} IN ({date_list})
+            """
+
+            logger.info(f"Deleting data for {len(dates)} dates from {dataset_id}.{table_id}")
+            await self._run_query(query)  # 쿼리 완료 대기
+
+            logger.info(f"Successfully deleted data for {len(dates)} dates")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete data for dates {sorted(dates)}: {str(e)}")
+            raise Exception(f"BigQuery 날짜별 데이터 삭제 실패: {str(e)}")
+
     async def truncate_table(self, dataset_id, table_id):
         """테이블의 모든 데이터를 삭제 (TRUNCATE)"""
         if not await self._table_exists(dataset_id, table_id):
@@ -223,8 +253,7 @@ class BigQueryClient:
             """
 
             logger.info(f"Truncating table {dataset_id}.{table_id}")
-            query_job = client.query(query)
-            query_job.result()  # 쿼리 완료 대기
+            await self._run_query(query)  # 쿼리 완료 대기
 
             logger.info(f"Successfully truncated table {dataset_id}.{table_id}")
             return True
@@ -291,7 +320,6 @@ class BigQueryClient:
             bool: 삽입 성공 여부
         """
         client = await self._get_client()
-        table_ref = client.get_table(table_id)
         total_rows = len(rows)
 
         if total_rows == 0:
@@ -300,7 +328,9 @@ class BigQueryClient:
 
         logger.info(f"Starting load: {total_rows} rows")
 
-        try:
+        def load():
+            table_ref = client.get_table(table_id)
+
             # DataFrame으로 변환
             df = pd.DataFrame(rows)
 
@@ -319,14 +349,16 @@ class BigQueryClient:
                 ignore_unknown_values=True  # 알 수 없는 필드 무시
             )
 
-            # 로드 작업 실행
+            # 로드 작업 실행 후 완료 대기
             job = client.load_table_from_file(
                 file_obj, table_ref, job_config=job_config
             )
-
-            # 작업 완료 대기
             job.result()
 
+        try:
+            # 직렬화 / 로드 대기는 다른 매체 작업을 막지 않도록 스레드에서 실행
+            await asyncio.to_thread(load)
+
             logger.info(f"Successfully loaded {total_rows} rows into {table_id}")
             return True
 
@@ -349,7 +381,7 @@ class BigQueryClient:
             if await self._table_exists(dataset_id, table_id):
                 # 테이블 생성 직후에는 약간의 전파 시간이 필요할 수 있음
                 if interval > 0:
-                    time.sleep(1) 
+                    await asyncio.sleep(1)
                 
                 try:
                     # _insert_rows에 스키마와 쓰기 방식을 함께 전달
@@ -363,10 +395,61 @@ class BigQueryClient:
                     logger.error(f"Error inserting rows: {str(e)}")
                     raise Exception(f"BigQuery 데이터 삽입 실패: {str(e)}")
 
-            time.sleep(0.3)
+            await asyncio.sleep(0.3)
 
         return {"status": "error", "message": "Table creation timeout after 30 seconds"}
     
+    async def replace_dates(self, dataset_id, table_id, schema, rows, dates, date_field="date"):
+        """
+        지정한 날짜들의 데이터를 원자적으로 교체
+        스테이징 테이블에 먼저 적재한 뒤 MERGE 한 번으로 삭제 + 삽입 (적재 실패 시 기존 데이터 유지)
+        dates에는 rows에 없는 날짜도 포함할 수 있음 (해당 날짜는 삭제만 됨)
+        """
+        if not await self._table_exists(dataset_id, table_id):
+            # 기존 데이터가 없으면 교체할 대상도 없으므로 바로 적재
+            return await self.insert_start(dataset_id, table_id, schema, rows)
+
+        client = await self._get_client()
+        target_address = f"{client.project}.{dataset_id}.{table_id}"
+        staging_id = f"{table_id}__staging_{uuid.uuid4().hex[:8]}"
+        staging_address = f"{client.project}.{dataset_id}.{staging_id}"
+
+        try:
+            staging = await self._create_table(dataset_id, staging_id, schema)
+            # 삭제하지 못한 스테이징 테이블은 하루 뒤 자동 삭제
+            staging.expires = datetime.now(timezone.utc) + timedelta(days=1)
+            await asyncio.to_thread(client.update_table, staging, ["expires"])
+
+            await self._insert_rows(staging_address, rows, schema=schema, write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE)
+
+            columns = ", ".join(f"`{field.name}`" for field in schema)
+            date_list = ", ".join(f"DATE('{date}')" for date in sorted(dates))
+            query = f"""
+            MERGE `{target_address}` T
+            USING `{staging_address}` S
+            ON FALSE
+            WHEN NOT MATCHED BY SOURCE AND T.{date_field} IN ({date_list}) THEN DELETE
+            WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({columns})
+            """
+
+            logger.info(f"Replacing {len(dates)} dates in {dataset_id}.{table_id} with {len(rows)} rows")
+            await self._run_query(query)
+
+            return {
+                "status": "success",
+                "message": f"Successfully replaced {len(dates)} dates with {len(rows)} rows",
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to replace dates {sorted(dates)}: {str(e)}")
+            raise Exception(f"BigQuery 날짜별 데이터 교체 실패: {str(e)}")
+
+        finally:
+            try:
+                await asyncio.to_thread(client.delete_table, staging_address, not_found_ok=True)
+            except Exception as e:
+                logger.warning(f"스테이징 테이블 삭제 실패: {staging_address}, 에러: {e}")
+
     async def query_all_data(self, dataset_id, table_id):
         """특정 테이블의 전체 데이터를 조회"""
         try:
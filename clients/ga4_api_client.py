@@ -1,6 +1,7 @@
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.admin_v1alpha import AnalyticsAdminServiceClient
 from google.analytics.data_v1beta.types import (
+    BatchRunReportsRequest,
     RunReportRequest,
     DateRange,
     Metric,
@@ -9,10 +10,23 @@ from google.analytics.data_v1beta.types import (
     FilterExpression,
     FilterExpressionList,
 )
-import logging
+from utils.ga4_client_manager import get_ga4_async_client
+from concurrent.futures import ThreadPoolExecutor
+import asyncio, logging, os
 
 logger = logging.getLogger(__name__)
 
+# 비동기 gRPC 클라이언트 사용 여부 / 동기 클라이언트 전용 스레드 수
+GA4_USE_ASYNC_CLIENT = os.getenv("GA4_USE_ASYNC_CLIENT", "true").lower() == "true"
+GA4_EXECUTOR_WORKERS = int(os.getenv("GA4_EXECUTOR_WORKERS", "4"))
+
+# 페이지당 최대 행 수 / batchRunReports 요청당 최대 리포트 수
+GA4_PAGE_LIMIT = 100000
+GA4_BATCH_SIZE = 5
+
+# 동기 GA4 호출 전용 스레드 풀 (기본 executor를 쓰는 다른 작업과 분리)
+_ga4_executor = ThreadPoolExecutor(max_workers=GA4_EXECUTOR_WORKERS, thread_name_prefix="ga4")
+
 
 class GA4APIClient:
     def __init__(self, config, property_id):
@@ -20,19 +34,50 @@ class GA4APIClient:
         self.client = BetaAnalyticsDataClient.from_service_account_info(config)
         self.admin = AnalyticsAdminServiceClient.from_service_account_info(config)
         self.property_id = property_id
-
-    def request_create_report(self, defaults, metrics, event_filters, start):
-        """GA4 탐색 보고서 생성 (페이지네이션 포함)"""
-
+        self._async_client = None
+        self._use_async_client = GA4_USE_ASYNC_CLIENT
+
+    async def _get_async_client(self):
+        """비동기 클라이언트 반환 (프로세스 단위로 공유, 생성 실패 시 None -> 스레드 풀 사용)"""
+        if self._async_client is None and self._use_async_client:
+            try:
+                self._async_client = await get_ga4_async_client(self.config)
+            except Exception as e:
+                logger.warning(f"GA4 비동기 클라이언트 생성 실패, 스레드 풀 사용: {e}")
+                self._use_async_client = False
+
+        return self._async_client
+
+    async def _run_in_executor(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_ga4_executor, func, *args)
+
+    async def _run_report(self, request: RunReportRequest):
+        """이벤트 루프를 막지 않고 run_report 실행"""
+        async_client = await self._get_async_client()
+        if async_client is not None:
+            return await async_client.run_report(request)
+
+        return await self._run_in_executor(self.client.run_report, request)
+
+    async def _batch_run_reports(self, request: BatchRunReportsRequest):
+        """이벤트 루프를 막지 않고 batch_run_reports 실행"""
+        async_client = await self._get_async_client()
+        if async_client is not None:
+            return await async_client.batch_run_reports(request)
+
+        return await self._run_in_executor(self.client.batch_run_reports, request)
+
+    def _build_request_params(self, defaults, metrics, event_filters, start, end="yesterday"):
+        """리포트 요청 파라미터 생성 (offset / limit 제외)"""
         # 필드명 정의
         default_dimensions = [Dimension(name=default) for default in defaults]
 
         request_params = {
             "property": f"properties/{self.property_id}",
-            "date_ranges": [DateRange(start_date=start, end_date="yesterday")],
+            "date_ranges": [DateRange(start_date=start, end_date=end)],
             "dimensions": default_dimensions,
             "metrics": [Metric(name=metric) for metric in metrics],
-            "limit": 100000,  # 최대 limit 설정
         }
 
         if event_filters:
@@ -54,47 +99,93 @@ class GA4APIClient:
             )
             request_params["dimension_filter"] = or_filter
 
+        return request_params
 
-        # 페이지네이션을 통해 모든 데이터 수집
-        all_rows = []
-        offset = 0
-        limit = 100000
-
-        while True:
-            request_params["offset"] = offset
-            request_params["limit"] = limit
-
-            request = RunReportRequest(**request_params)
-            response = self.client.run_report(request)
-
-            # 데이터가 없으면 종료
-            if not response.rows:
-                break
+    async def iter_report_pages(self, defaults, metrics, event_filters, start, end="yesterday"):
+        """
+        GA4 탐색 보고서를 페이지 단위로 반환 (async generator)
+        현재 페이지를 처리하는 동안 다음 페이지를 미리 요청하고, 전체 행을 한 response에 모으지 않음
+        """
+        request_params = self._build_request_params(defaults, metrics, event_filters, start, end)
 
-            # 수집된 rows 추가
-            all_rows.extend(response.rows)
-            rows_count = len(response.rows)
+        def fetch(offset):
+            request = RunReportRequest(**request_params, offset=offset, limit=GA4_PAGE_LIMIT)
+            return asyncio.create_task(self._run_report(request))
 
-            logger.info(f"Fetched {rows_count} rows (offset: {offset}, total: {len(all_rows)})")
-
-            # 반환된 row 개수가 limit보다 작으면 마지막 페이지
-            if rows_count < limit:
-                break
-
-            offset += limit
-
-        logger.info(f"Total rows fetched: {len(all_rows)}")
-
-        # 마지막 response의 rows를 전체 수집된 rows로 교체
-        if all_rows:
-            # protobuf repeated field 클리어 후 재추가
-            del response.rows[:]
-            response.rows.extend(all_rows)
-
-        return response
-
-    def properties_list(self):
-        response = self.admin.list_accounts()
+        offset = 0
+        total = 0
+        task = fetch(offset)
+
+        try:
+            while task is not None:
+                response = await task
+                rows_count = len(response.rows)
+                total += rows_count
+                logger.info(f"Fetched {rows_count} rows (offset: {offset}, total: {total})")
+
+                # 반환된 row 개수가 limit과 같으면 다음 페이지 미리 요청
+                task = None
+                if rows_count == GA4_PAGE_LIMIT:
+                    offset += GA4_PAGE_LIMIT
+                    task = fetch(offset)
+
+                if rows_count:
+                    yield response
+
+        finally:
+            # 소비 중단 시 미리 요청한 페이지 취소
+            if task is not None:
+                task.cancel()
+
+        logger.info(f"Total rows fetched: {total}")
+
+    async def iter_batch_report_pages(self, definitions):
+        """
+        같은 속성의 리포트 여러 개를 batchRunReports로 조회 (요청당 최대 5개)
+        definitions: {key: (defaults, metrics, event_filters, start, end)}
+        (key, RunReportResponse) 페이지 단위로 반환, 다음 페이지가 남은 리포트는 다시 묶어서 미리 요청
+        """
+        params = {key: self._build_request_params(*definition) for key, definition in definitions.items()}
+        offsets = {key: 0 for key in params}
+
+        async def run_batch(keys):
+            requests = [
+                RunReportRequest(**params[key], offset=offsets[key], limit=GA4_PAGE_LIMIT) for key in keys
+            ]
+            batch_request = BatchRunReportsRequest(property=f"properties/{self.property_id}", requests=requests)
+            batch_response = await self._batch_run_reports(batch_request)
+            return list(zip(keys, batch_response.reports))
+
+        def fetch(pending):
+            chunks = [pending[i : i + GA4_BATCH_SIZE] for i in range(0, len(pending), GA4_BATCH_SIZE)]
+            return asyncio.ensure_future(asyncio.gather(*(run_batch(keys) for keys in chunks)))
+
+        task = fetch(list(params))
+
+        try:
+            while task is not None:
+                pages = [item for result in await task for item in result]
+
+                # 반환된 row 개수가 limit과 같은 리포트만 다음 페이지 미리 요청
+                pending = []
+                for key, response in pages:
+                    logger.info(f"{key}: fetched {len(response.rows)} rows (offset: {offsets[key]})")
+                    if len(response.rows) == GA4_PAGE_LIMIT:
+                        offsets[key] += GA4_PAGE_LIMIT
+                        pending.append(key)
+
+                task = fetch(pending) if pending else None
+
+                for key, response in pages:
+                    if response.rows:
+                        yield key, response
+
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def properties_list(self):
+        response = await self._run_in_executor(lambda: list(self.admin.list_accounts()))
 
         properties = []
         for property in response:
@@ -107,7 +198,14 @@ class GA4APIClient:
 
         return properties
 
-    def get_metadata(self):
+    async def get_property_timezone(self):
+        """GA4 속성의 보고 시간대 (예: Asia/Seoul)"""
+        property = await self._run_in_executor(
+            lambda: self.admin.get_property(name=f"properties/{self.property_id}")
+        )
+        return property.time_zone
+
+    async def get_metadata(self):
         """GA4 속성의 사용가능한 차원과 측정항목 조회"""
         from google.analytics.data_v1beta.types import GetMetadataRequest
 
@@ -115,7 +213,11 @@ class GA4APIClient:
             name=f"properties/{self.property_id}/metadata"
         )
 
-        response = self.client.get_metadata(request)
+        async_client = await self._get_async_client()
+        if async_client is not None:
+            response = await async_client.get_metadata(request)
+        else:
+            response = await self._run_in_executor(self.client.get_metadata, request)
 
         # 차원(Dimensions) 정리
         dimensions = []
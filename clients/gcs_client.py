@@ -1,6 +1,8 @@
 from google.cloud import storage
+from google.api_core.exceptions import NotFound
 from utils.gcs_client_manager import get_gcs_client
-import logging
+from typing import Optional
+import asyncio, logging
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -147,6 +149,42 @@ class GCSClient:
             logger.error(f"Failed to download file from GCS: {str(e)}")
             raise Exception(f"GCS 파일 다운로드 실패: {str(e)}")
 
+    async def read_bytes(self, blob_name: str) -> Optional[bytes]:
+        """
+        GCS 파일 내용을 바이트로 반환 (이벤트 루프를 막지 않도록 스레드에서 다운로드)
+
+        Args:
+            blob_name: 읽을 파일 경로
+
+        Returns:
+            Optional[bytes]: 파일 내용 (파일이 없으면 None)
+        """
+        client = await self._get_client()
+        blob = client.bucket(self.bucket_name).blob(blob_name)
+
+        try:
+            return await asyncio.to_thread(blob.download_as_bytes)
+        except NotFound:
+            return None
+
+    async def write_bytes(self, data: bytes, blob_name: str, content_type: str = "application/octet-stream") -> str:
+        """
+        바이트 데이터를 GCS 파일로 저장 (이벤트 루프를 막지 않도록 스레드에서 업로드)
+
+        Args:
+            data: 저장할 내용
+            blob_name: 저장할 파일 경로
+            content_type: 파일 content type
+
+        Returns:
+            str: GCS URI (gs://bucket/path)
+        """
+        client = await self._get_client()
+        blob = client.bucket(self.bucket_name).blob(blob_name)
+        await asyncio.to_thread(blob.upload_from_string, data, content_type=content_type)
+
+        return f"gs://{self.bucket_name}/{blob_name}"
+
     async def generate_signed_url(
         self,
         blob_name: str,
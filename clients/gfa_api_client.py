@@ -1,5 +1,6 @@
 from utils.http_client_manager import get_http_client
-from typing import Dict, Any
+from utils.backoff import backoff_delays
+from typing import Dict, Any, List
 import logging, asyncio
 
 logger = logging.getLogger(__name__)
@@ -11,41 +12,48 @@ class GFAAPIClient:
         self.access_token = access_token
 
     async def _make_request(self, method, uri, params=None, retry=5) -> Dict[str, Any]:
+        """
+        GFA API 요청 (실패 시 지수 백오프로 재시도)
+        429 이외의 4xx 응답은 다시 요청해도 결과가 같으므로 재시도하지 않음
+        """
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"지원하지 않는 요청입니다 : {method}")
+
         url = self.base_url + uri
         headers = {"Authorization": f"Bearer {self.access_token}"}
         last_error = "Unknown error"
+        status_code = None
+        delays = backoff_delays(base=1.0, max_delay=10.0)
 
         for attempt in range(retry):
             try:
                 client = await get_http_client()
-                if method.upper() == "GET":
+                if method == "GET":
                     response = await client.get(url, headers=headers)
-                    
-                    if response.status_code == 200:
-                        return response.json()
-
-                    last_error = f"HTTP {response.status_code}: {response.text}"
-                    if attempt < retry - 1:
-                        logger.warning(f"Non-200 response ({response.status_code}). Retrying... ({attempt + 1}/{retry})")
-                        await asyncio.sleep(10)
-                        continue
-                elif method.upper() == "POST":
+                else:
                     response = await client.post(url, headers=headers, json=params)
 
-                    if response.status_code == 200:
-                        return response.json()
-                    
-                else:
-                    raise ValueError(f"지원하지 않는 요청입니다 : {method}")
+                if response.status_code == 200:
+                    return response.json()
+
+                status_code = response.status_code
+                last_error = f"HTTP {status_code}: {response.text}"
+                if 400 <= status_code < 500 and status_code != 429:
+                    break
+
+                logger.warning(f"Non-200 response ({response.status_code}). Retrying... ({attempt + 1}/{retry})")
 
             except Exception as e:
+                status_code = None
                 last_error = str(e)
-                if attempt < retry - 1:
-                    logger.warning(f"Request failed: {str(e)}. Retrying... ({attempt + 1}/{retry})")
-                    continue
+                logger.warning(f"Request failed: {str(e)}. Retrying... ({attempt + 1}/{retry})")
 
-        logger.error(f"Max retries reached. Last error: {last_error}")
-        return {"status": "error", "message": last_error}
+            if attempt < retry - 1:
+                await asyncio.sleep(next(delays))
+
+        logger.error(f"{method} {uri} 요청 실패. Last error: {last_error}")
+        return {"status": "error", "message": last_error, "status_code": status_code}
 
     async def get_manage_accounts(self) -> Dict[str, Any]:
         uri = "/adAccounts"
@@ -76,11 +84,17 @@ class GFAAPIClient:
             uri = f"/adAccounts/{self.account_no}/creatives?page={page}&size=100"
 
         else:
-            uri = f"/adAccounts/{self.account_no}/creatives?page={page}&size=100&actiavted={activated}"
+            uri = f"/adAccounts/{self.account_no}/creatives?page={page}&size=100&activated={activated}"
 
         response = await self._make_request("GET", uri)
         return response
 
+    async def get_structure(self, target: str, no: Any, retry: int = 1) -> Dict[str, Any]:
+        """ 캠페인, 광고그룹, 소재 단건 조회 (target: campaigns / adSets / creatives) """
+        uri = f"/adAccounts/{self.account_no}/{target}/{no}"
+        response = await self._make_request("GET", uri, retry=retry)
+        return response
+
     async def get_performance(self, start_date, end_date) -> Dict[str, Any]:
         uri = f"/adAccounts/{self.account_no}/performance/past/creatives"
         query = f"?startDate={start_date}&endDate={end_date}"
@@ -89,8 +103,12 @@ class GFAAPIClient:
     
     async def adjust_adset_budget(self, id: int, adjust_amount: float):
         """ 예산을 변경합니다. IMWEB 한정 """
+        return await self.adjust_adsets_budget([id], adjust_amount)
+
+    async def adjust_adsets_budget(self, ids: List[int], adjust_amount: float):
+        """ 여러 광고그룹의 예산을 같은 금액으로 한 번에 변경합니다. """
         uri = f"/adAccounts/{self.account_no}/adSets/edit"
-        params = {"adSetNos": [id],
+        params = {"adSetNos": ids,
                   "editType": "AdSetEditBudgetParam",
                   "budgetAmount": adjust_amount
                   }
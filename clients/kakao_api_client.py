@@ -8,7 +8,8 @@ class KakaoAPIClient:
         self.token = token
         self.account_id = account_id
 
-    async def _make_request(self, method, url, params=None):
+    async def _send_request(self, method, url, params=None) -> httpx.Response:
+        """응답 상태 확인 없이 응답 객체 반환 (요청 제한 헤더 확인용)"""
         headers = {
             "Authorization": f"Bearer {self.token}",
             "adAccountId": self.account_id,
@@ -21,6 +22,10 @@ class KakaoAPIClient:
         else:
             raise ValueError(f"지원하지 않는 요청입니다: {method}")
 
+        return response
+
+    async def _make_request(self, method, url, params=None):
+        response = await self._send_request(method, url, params)
         response.raise_for_status()
         return response.json()
 
@@ -114,11 +119,16 @@ class KakaoAPIClient:
         return creatives
 
     async def get_moment_report(self, creatives):
+        response = await self.request_moment_report(creatives)
+        response.raise_for_status()
+        return response.json()["data"]
+
+    async def request_moment_report(self, creatives) -> httpx.Response:
+        # 429 / 요청 제한 헤더 확인을 위해 응답 객체 그대로 반환
         url = "https://apis.moment.kakao.com/openapi/v4/creatives/report"
         params = f"?datePreset=YESTERDAY&dimension=CREATIVE_FORMAT&metricsGroup=BASIC&creativeId={creatives}"
 
-        response = await self._make_request("GET", url + params)
-        return response["data"]
+        return await self._send_request("GET", url + params)
     
     async def test(self):
         url = "https://apis.moment.kakao.com/openapi/v4/creatives/report"
@@ -1,23 +1,32 @@
 import requests
 import httpx
-import logging, dotenv, json
+import asyncio, logging, dotenv, json, os
 import pandas as pd
 from utils.http_client_manager import get_http_client
+from utils.backoff import backoff_delays
+from clients.meta_graph_batcher import MetaGraphBatcher
+from typing import Optional
 
 dotenv.load_dotenv()
 logger = logging.getLogger(__name__)
 
+# 비동기 리포트 작업 대기 시간(초) / 결과 다운로드 페이지 크기
+META_ASYNC_TIMEOUT = float(os.getenv("META_ASYNC_TIMEOUT", "900"))
+META_ASYNC_PAGE_LIMIT = int(os.getenv("META_ASYNC_PAGE_LIMIT", "5000"))
+
 
 class MetaAdsAPIClient:
-    def __init__(self, access_token, app_id, app_secret, account_id):
+    def __init__(self, access_token, app_id, app_secret, account_id, batcher: Optional[MetaGraphBatcher] = None):
         self.access_token = access_token
         self.app_id = app_id
         self.app_secret = app_secret
         self.account_id = account_id
         self.base_url = "https://graph.facebook.com/v23.0"
+        # 지정 시 요청을 Graph API 배치로 묶어서 전송
+        self.batcher = batcher
 
-    async def _make_request(self, endpoint, params=None):
-        """API 요청 공통 함수"""
+    async def _make_request(self, endpoint, params=None, batch=True):
+        """API 요청 공통 함수 (batch=False 이면 배처를 거치지 않고 바로 요청)"""
         if params is None:
             params = {}
 
@@ -26,6 +35,9 @@ class MetaAdsAPIClient:
         url = f"{self.base_url}/{endpoint}"
 
         try:
+            if batch and self.batcher is not None:
+                return await self.batcher.request("GET", endpoint, params)
+
             client = await get_http_client()
             response = await client.get(url, params=params)
             response.raise_for_status()
@@ -35,6 +47,28 @@ class MetaAdsAPIClient:
             logger.error(f"Meta API 요청 실패: {e}")
             raise
 
+    async def _post_request(self, endpoint, params=None, batch=True):
+        """API POST 요청 공통 함수 (batch=False 이면 배처를 거치지 않고 바로 요청)"""
+        if params is None:
+            params = {}
+
+        params["access_token"] = self.access_token
+
+        url = f"{self.base_url}/{endpoint}"
+
+        try:
+            if batch and self.batcher is not None:
+                return await self.batcher.request("POST", endpoint, params)
+
+            client = await get_http_client()
+            response = await client.post(url, params=params)
+            response.raise_for_status()
+            return response.json()
+
+        except Exception as e:
+            logger.error(f"Meta API 요청 실패: {e}")
+            raise
+
 
     async def verify_account_in_list(self):
         """내 계정 목록에서 특정 계정 찾기"""
@@ -73,37 +107,46 @@ class MetaAdsAPIClient:
         except Exception as e:
             return {"error": str(e)}
 
-    async def get_adset_performance(self, fields, start_date=None, end_date=None):
+    def _insights_params(self, fields, start_date=None, end_date=None, time_increment=None):
+        params = {
+            "fields": ",".join(fields),
+            "level": "ad",  # 광고셋 레벨
+            "use_account_attribution_setting": True,
+        }
+
+        if start_date and end_date:
+            params["time_range"] = json.dumps(
+                {
+                    "since": start_date,  # "2024-08-01"
+                    "until": end_date,  # "2024-08-05"
+                }
+            )
+
+        else:
+            params["date_preset"] = "yesterday"
+
+        # 1이면 기간 합계 대신 일별 행 반환
+        if time_increment:
+            params["time_increment"] = time_increment
+
+        return params
+
+    async def get_adset_performance(self, fields, start_date=None, end_date=None, time_increment=None):
         """광고셋 단위 성과 데이터 조회"""
         all_data = []
         next_cursor = None
 
         while True:
-            params = {
-                "access_token": self.access_token,
-                "fields": ",".join(fields),
-                "level": "ad",  # 광고셋 레벨
-                "use_account_attribution_setting": True,
-                "limit": 100,
-            }
-
-            if start_date and end_date:
-                params["time_range"] = json.dumps(
-                    {
-                        "since": start_date,  # "2024-08-01"
-                        "until": end_date,  # "2024-08-05"
-                    }
-                )
-
-            else:
-                params["date_preset"] = "yesterday"
+            params = self._insights_params(fields, start_date, end_date, time_increment)
+            params["limit"] = 100
 
             if next_cursor:
                 params["after"] = next_cursor
 
             try:
+                # 인사이트 조회는 배치 하위 요청 시간 제한에 걸릴 수 있으므로 바로 요청
                 end_point = f"act_{self.account_id}/insights"
-                response = await self._make_request(end_point, params)
+                response = await self._make_request(end_point, params, batch=False)
                 all_data.extend(response.get("data", []))
 
                 # 다음 페이지가 있는지 확인
@@ -113,6 +156,69 @@ class MetaAdsAPIClient:
                     break  # 더 이상 페이지 없음
 
             except Exception as e:
-                return {"error": str(e)}
+                # 에러 dict를 데이터처럼 반환하면 행 변환에서 원인을 알 수 없는 오류가 나므로 바로 실패 처리
+                raise Exception(f"Meta 인사이트 조회 실패 (act_{self.account_id}): {str(e)}")
+
+        return all_data
+
+    async def get_ads_count(self):
+        """계정의 광고 수 조회 (리포트 행 수 추정용)"""
+        end_point = f"act_{self.account_id}/ads"
+        params = {"summary": "total_count", "limit": 1, "fields": "id"}
+
+        response = await self._make_request(end_point, params)
+        return int(response.get("summary", {}).get("total_count", 0))
+
+    async def get_adset_performance_async(self, fields, start_date=None, end_date=None, time_increment=None):
+        """비동기 리포트 작업으로 광고 단위 성과 데이터 조회 (대용량 계정용)"""
+        end_point = f"act_{self.account_id}/insights"
+        params = self._insights_params(fields, start_date, end_date, time_increment)
+
+        response = await self._post_request(end_point, params, batch=False)
+        report_run_id = response["report_run_id"]
+        logger.info(f"Meta 비동기 리포트 작업 생성: {report_run_id}")
+
+        await self._wait_report_run(report_run_id)
+        return await self._download_report_run(report_run_id)
+
+    async def _wait_report_run(self, report_run_id):
+        """리포트 작업 완료까지 상태 조회 (이벤트 루프를 막지 않고 대기)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + META_ASYNC_TIMEOUT
+        params = {"fields": "async_status,async_percent_completion"}
+
+        for delay in backoff_delays(base=1.0, factor=1.5, max_delay=15.0):
+            response = await self._make_request(report_run_id, dict(params))
+            status = response.get("async_status")
+
+            if status == "Job Completed":
+                return
+
+            if status in ("Job Failed", "Job Skipped"):
+                raise Exception(f"Meta 리포트 작업 실패: {report_run_id} ({status})")
+
+            if loop.time() + delay > deadline:
+                raise Exception(f"Meta 리포트 작업 시간 초과: {report_run_id}")
+
+            logger.info(f"Meta 리포트 작업 진행 중: {report_run_id} ({response.get('async_percent_completion')}%)")
+            await asyncio.sleep(delay)
+
+    async def _download_report_run(self, report_run_id):
+        """완료된 리포트 작업 결과를 큰 페이지 단위로 다운로드"""
+        all_data = []
+        next_cursor = None
+
+        while True:
+            params = {"limit": META_ASYNC_PAGE_LIMIT}
+            if next_cursor:
+                params["after"] = next_cursor
+
+            response = await self._make_request(f"{report_run_id}/insights", params, batch=False)
+            all_data.extend(response.get("data", []))
+
+            if "paging" in response and "next" in response["paging"]:
+                next_cursor = response["paging"]["cursors"]["after"]
+            else:
+                break
 
         return all_data
@@ -0,0 +1,133 @@
+from utils.http_client_manager import get_http_client
+from urllib.parse import urlencode
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio, json, logging
+
+logger = logging.getLogger(__name__)
+
+
+class MetaGraphBatcher:
+    """
+    Graph API 배치 요청 처리기
+    짧은 시간(window) 동안 들어온 요청을 최대 50개씩 묶어 한 번의 POST로 보내고,
+    응답을 각 요청자에게 나누어 전달 (여러 광고 계정 클라이언트가 함께 사용 가능)
+    """
+
+    MAX_BATCH_SIZE = 50  # Graph API 배치 요청 최대 개수
+
+    def __init__(
+        self,
+        access_token: str,
+        base_url: str = "https://graph.facebook.com/v23.0",
+        window: float = 0.01,
+    ):
+        self.access_token = access_token
+        self.base_url = base_url
+        self.window = window
+
+        self._queue: List[Tuple[dict, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._send_tasks = set()
+
+    async def request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """배치에 요청 추가 후 해당 요청의 응답 본문 반환"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((self._build_request(method, endpoint, params), future))
+
+        if len(self._queue) >= self.MAX_BATCH_SIZE:
+            self._send(self._take())
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+        return await future
+
+    def _build_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> dict:
+        params = {
+            key: str(value).lower() if isinstance(value, bool) else value
+            for key, value in (params or {}).items()
+            if key != "access_token"
+        }
+
+        if method.upper() == "GET":
+            relative_url = f"{endpoint}?{urlencode(params)}" if params else endpoint
+            return {"method": "GET", "relative_url": relative_url}
+
+        return {"method": method.upper(), "relative_url": endpoint, "body": urlencode(params)}
+
+    def _take(self) -> List[Tuple[dict, asyncio.Future]]:
+        batch = self._queue[: self.MAX_BATCH_SIZE]
+        self._queue = self._queue[self.MAX_BATCH_SIZE :]
+        return batch
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.window)
+        self._flush_task = None
+
+        while self._queue:
+            self._send(self._take())
+
+    def _send(self, batch: List[Tuple[dict, asyncio.Future]]):
+        task = asyncio.create_task(self._send_batch(batch))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+
+    async def _send_batch(self, batch: List[Tuple[dict, asyncio.Future]]):
+        requests = [request for request, _ in batch]
+        futures = [future for _, future in batch]
+        logger.info(f"Meta 배치 요청: {len(requests)}건")
+
+        try:
+            client = await get_http_client()
+            response = await client.post(
+                self.base_url,
+                data={
+                    "access_token": self.access_token,
+                    "batch": json.dumps(requests),
+                    "include_headers": "false",
+                },
+            )
+            response.raise_for_status()
+            results = response.json()
+
+        except Exception as e:
+            logger.error(f"Meta 배치 요청 실패: {e}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # 응답이 목록이 아니거나 개수가 다르면 짝이 맞지 않는 요청은 실패 처리 (대기자가 멈추지 않도록)
+        if not isinstance(results, list):
+            logger.error(f"Meta 배치 응답 형식 오류: {type(results).__name__}")
+            results = []
+        elif len(results) != len(requests):
+            logger.error(f"Meta 배치 응답 개수 불일치: 요청 {len(requests)}건, 응답 {len(results)}건")
+
+        for request, future in zip(requests[len(results) :], futures[len(results) :]):
+            if not future.done():
+                future.set_exception(Exception(f"Meta 배치 하위 요청 응답 없음: {request['relative_url']}"))
+
+        for request, future, result in zip(requests, futures, results):
+            if future.done():
+                continue
+
+            try:
+                self._resolve(request, future, result)
+            except Exception as e:
+                # 하위 응답 형식이 다른 경우 (dict가 아님, body 해석 실패 등)
+                future.set_exception(Exception(f"Meta 배치 하위 응답 처리 실패: {request['relative_url']} - {e}"))
+
+    def _resolve(self, request: dict, future: asyncio.Future, result: Any):
+        """하위 응답 하나를 해당 요청자에게 전달"""
+        # 처리 시간이 초과된 하위 요청은 null로 반환됨
+        if result is None:
+            future.set_exception(Exception(f"Meta 배치 하위 요청 시간 초과: {request['relative_url']}"))
+            return
+
+        body = json.loads(result.get("body") or "{}")
+        if result.get("code") != 200:
+            message = body.get("error", {}).get("message", body)
+            future.set_exception(Exception(f"Meta API 요청 실패 ({result.get('code')}): {message}"))
+            return
+
+        future.set_result(body)
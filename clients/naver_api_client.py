@@ -68,11 +68,14 @@ class NaverAPIClient:
         response = await self._make_request("POST", uri, data)
         return response.json()["reportJobId"]
 
-    async def create_master_report(self, item_type):
-        """마스터 리포트 생성 API"""
+    async def create_master_report(self, item_type, from_time=None):
+        """마스터 리포트 생성 API (from_time 지정 시 해당 시각 이후 변경분만 생성)"""
         uri = "/master-reports"
         data = {"item": item_type}
 
+        if from_time is not None:
+            data["fromTime"] = from_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+
         response = await self._make_request("POST", uri, data)
         return response.json()["id"]
 
@@ -1,5 +1,5 @@
 from utils.http_client_manager import get_http_client
-from typing import Dict, Any, Optional
+from typing import Dict, Any, IO, Optional
 from datetime import datetime, timedelta
 import logging, os, json
 
@@ -24,6 +24,9 @@ class TikTokAPIClient:
             if method.upper() == "GET":
                 response = await client.get(url, headers=self.headers, params=params)
 
+            elif method.upper() == "POST":
+                response = await client.post(url, headers=self.headers, json=params)
+
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
@@ -67,4 +70,38 @@ class TikTokAPIClient:
         response = await self._make_request("GET", uri, params=params)
 
         return response
-    
\ No newline at end of file
+
+    def _report_params(self, dimensions_list: list, metrics_list: list) -> Dict[str, Any]:
+        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        return {
+            "advertiser_id": self.account_id,
+            "service_type": "AUCTION",
+            "data_level": "AUCTION_AD",
+            "report_type": "BASIC",
+            "dimensions": dimensions_list,
+            "metrics": metrics_list,
+            "start_date": yesterday,
+            "end_date": yesterday,
+        }
+
+    # 비동기 리포트 작업 (대용량 광고주)
+    async def create_report_task(self, dimensions_list: list, metrics_list: list) -> Dict[str, Any]:
+        uri = "/report/task/create/"
+        params = self._report_params(dimensions_list, metrics_list)
+        return await self._make_request("POST", uri, params=params)
+
+    async def check_report_task(self, task_id: str) -> Dict[str, Any]:
+        uri = "/report/task/check/"
+        params = {"advertiser_id": self.account_id, "task_id": task_id}
+        return await self._make_request("GET", uri, params=params)
+
+    async def download_report_task(self, task_id: str, file_obj: IO[bytes]):
+        """리포트 결과 파일(CSV)을 메모리에 한 번에 올리지 않고 file_obj에 나누어 기록"""
+        url = self.base_url + "/report/task/download/"
+        params = {"advertiser_id": self.account_id, "task_id": task_id}
+        client = await get_http_client()
+
+        async with client.stream("GET", url, headers=self.headers, params=params) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                file_obj.write(chunk)
@@ -0,0 +1,123 @@
+from database.mongodb import MongoDB
+from pymongo import UpdateOne
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+import logging, os
+
+logger = logging.getLogger(__name__)
+
+# 매체별 캐시 유지 시간 (ENTITY_CACHE_TTL_HOURS_<매체> 환경 변수로 변경 가능)
+# 모먼트는 마지막으로 조회된 ID -> 이름 매핑만 저장하고 TTL 없이(include_stale) 목록 조회 실패 시 대체용으로 사용
+ENTITY_CACHE_TTL_HOURS = {
+    "gfa": float(os.getenv("ENTITY_CACHE_TTL_HOURS_GFA", "24")),
+    "kakao": float(os.getenv("ENTITY_CACHE_TTL_HOURS_KAKAO", "24")),
+}
+DEFAULT_ENTITY_CACHE_TTL_HOURS = 24
+
+
+class EntityCache:
+    """
+    광고 구조(캠페인 / 그룹 / 키워드 / 소재) 정보 캐시
+    (매체, 계정, 타입, ID) 단위로 MongoDB에 저장하고 매체별 TTL이 지난 항목은 무시
+    캐시 조회 실패 시에는 캐시 없이 API 조회 결과를 그대로 사용
+    """
+
+    _index_ready = False
+
+    def __init__(self, platform: str, account_id: Any):
+        self.platform = platform
+        self.account_id = str(account_id)
+        self.ttl = timedelta(hours=ENTITY_CACHE_TTL_HOURS.get(platform, DEFAULT_ENTITY_CACHE_TTL_HOURS))
+
+    async def _get_collection(self):
+        mongo_client = await MongoDB.get_instance()
+        collection = mongo_client["Customers"].get_collection("entity_cache")
+
+        if not EntityCache._index_ready:
+            collection.create_index(
+                [("platform", 1), ("account_id", 1), ("entity_type", 1), ("entity_id", 1)],
+                unique=True,
+            )
+            EntityCache._index_ready = True
+
+        return collection
+
+    def _query(self, entity_type: str, ids: Optional[Iterable[Any]] = None) -> dict:
+        query = {"platform": self.platform, "account_id": self.account_id, "entity_type": entity_type}
+        if ids is not None:
+            query["entity_id"] = {"$in": [str(entity_id) for entity_id in ids]}
+        return query
+
+    async def get_many(
+        self, entity_type: str, ids: Optional[Iterable[Any]] = None, include_stale: bool = False
+    ) -> Dict[str, dict]:
+        """TTL 이내 항목 반환 {entity_id: data} (ids 미지정 시 해당 타입 전체, include_stale=True 이면 TTL 무시)"""
+        try:
+            collection = await self._get_collection()
+            query = self._query(entity_type, ids)
+            if not include_stale:
+                query["updated_at"] = {"$gte": datetime.now(timezone.utc) - self.ttl}
+
+            cursor = collection.find(query, {"entity_id": 1, "data": 1})
+            return {doc["entity_id"]: doc["data"] for doc in cursor}
+
+        except Exception as e:
+            logger.warning(f"{self.platform} {entity_type} 캐시 조회 실패: {e}")
+            return {}
+
+    async def put_many(self, entity_type: str, entities: Dict[Any, dict]):
+        """항목 저장 (이미 있으면 갱신)"""
+        if not entities:
+            return
+
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne(
+                {
+                    "platform": self.platform,
+                    "account_id": self.account_id,
+                    "entity_type": entity_type,
+                    "entity_id": str(entity_id),
+                },
+                {"$set": {"data": data, "updated_at": now}},
+                upsert=True,
+            )
+            for entity_id, data in entities.items()
+        ]
+
+        try:
+            collection = await self._get_collection()
+            collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.warning(f"{self.platform} {entity_type} 캐시 저장 실패: {e}")
+
+    async def invalidate(self, entity_type: str, ids: Optional[Iterable[Any]] = None):
+        """변경된 항목 삭제 (ids 미지정 시 해당 타입 전체)"""
+        try:
+            collection = await self._get_collection()
+            result = collection.delete_many(self._query(entity_type, ids))
+            logger.info(f"{self.platform} {entity_type} 캐시 {result.deleted_count}건 삭제")
+        except Exception as e:
+            logger.warning(f"{self.platform} {entity_type} 캐시 삭제 실패: {e}")
+
+    async def get_or_refresh(
+        self,
+        entity_type: str,
+        ids: Iterable[Any],
+        refresh: Callable[[set], Awaitable[Dict[Any, dict]]],
+    ) -> Dict[str, dict]:
+        """
+        ids 항목 반환 (캐시에 없는 ID만 refresh로 조회 후 저장)
+        refresh는 누락 ID 집합(문자열)을 받아 {entity_id: data}를 반환, 누락 ID 외 항목도 함께 저장됨
+        """
+        ids = {str(entity_id) for entity_id in ids}
+        entities = await self.get_many(entity_type, ids) if ids else {}
+
+        missing = ids - entities.keys()
+        if missing:
+            logger.info(f"{self.platform} {entity_type} 캐시 누락 {len(missing)}건 조회")
+            refreshed = {str(entity_id): data for entity_id, data in (await refresh(missing)).items()}
+            await self.put_many(entity_type, refreshed)
+            entities.update(refreshed)
+
+        return entities
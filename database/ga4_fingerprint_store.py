@@ -0,0 +1,69 @@
+from database.mongodb import MongoDB
+from pymongo import UpdateOne
+from datetime import datetime, timezone
+from typing import Any, Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GA4FingerprintStore:
+    """
+    GA4 테이블의 일자별 지문(행 수 + 측정항목 합계) 저장소
+    (데이터셋, 테이블, 날짜) 단위로 MongoDB에 저장하여 다음 실행 때 변경된 날짜만 다시 적재
+    조회 실패 시에는 지문이 없는 것으로 보고 전체 기간을 다시 적재
+    """
+
+    _index_ready = False
+
+    def __init__(self, data_set_name: str, table_name: str):
+        self.data_set_name = data_set_name
+        self.table_name = table_name
+
+    async def _get_collection(self):
+        mongo_client = await MongoDB.get_instance()
+        collection = mongo_client["Customers"].get_collection("ga4_fingerprints")
+
+        if not GA4FingerprintStore._index_ready:
+            collection.create_index(
+                [("data_set_name", 1), ("table_name", 1), ("date", 1)],
+                unique=True,
+            )
+            GA4FingerprintStore._index_ready = True
+
+        return collection
+
+    async def get_all(self) -> Dict[str, Dict[str, Any]]:
+        """저장된 지문 반환 {date: {"rows": 행 수, "metrics": {측정항목: 합계}}}"""
+        try:
+            collection = await self._get_collection()
+            cursor = collection.find(
+                {"data_set_name": self.data_set_name, "table_name": self.table_name},
+                {"date": 1, "rows": 1, "metrics": 1},
+            )
+            return {doc["date"]: {"rows": doc["rows"], "metrics": doc["metrics"]} for doc in cursor}
+
+        except Exception as e:
+            logger.warning(f"{self.table_name} 지문 조회 실패: {e}")
+            return {}
+
+    async def put_many(self, fingerprints: Dict[str, Dict[str, Any]]):
+        """일자별 지문 저장 (이미 있으면 갱신)"""
+        if not fingerprints:
+            return
+
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne(
+                {"data_set_name": self.data_set_name, "table_name": self.table_name, "date": date},
+                {"$set": {**fingerprint, "updated_at": now}},
+                upsert=True,
+            )
+            for date, fingerprint in fingerprints.items()
+        ]
+
+        try:
+            collection = await self._get_collection()
+            collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.warning(f"{self.table_name} 지문 저장 실패: {e}")
@@ -0,0 +1,70 @@
+from database.mongodb import MongoDB
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import asyncio, json, logging
+
+logger = logging.getLogger(__name__)
+
+
+class JobStore:
+    """
+    백그라운드 작업 상태 저장소 (Customers.jobs)
+    작업을 실행하지 않은 다른 인스턴스에서도 상태 / 결과를 조회할 수 있도록 상태가 바뀔 때마다 저장
+    저장 실패 시에는 경고만 남기고 작업은 계속 진행
+    """
+
+    _index_ready = False
+
+    async def _get_collection(self):
+        mongo_client = await MongoDB.get_instance()
+        collection = mongo_client["Customers"].get_collection("jobs")
+
+        if not JobStore._index_ready:
+            await asyncio.to_thread(collection.create_index, "job_id", unique=True)
+            await asyncio.to_thread(collection.create_index, "created_at")
+            JobStore._index_ready = True
+
+        return collection
+
+    async def save(self, job: Dict[str, Any]):
+        """작업 상태 저장 (이미 있으면 갱신, 직렬화 / 저장은 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        try:
+            collection = await self._get_collection()
+
+            def upsert():
+                # 결과에 BSON으로 저장할 수 없는 값이 있을 수 있으므로 JSON 형태로 변환
+                document = json.loads(json.dumps(job, ensure_ascii=False, default=str))
+                document["updated_at"] = datetime.now(timezone.utc)
+                collection.update_one({"job_id": job["job_id"]}, {"$set": document}, upsert=True)
+
+            await asyncio.to_thread(upsert)
+
+        except Exception as e:
+            logger.warning(f"작업 상태 저장 실패 ({job.get('job_id')}): {e}")
+
+    async def get(self, job_id: str, include_result: bool = True) -> Optional[Dict[str, Any]]:
+        try:
+            collection = await self._get_collection()
+            projection = {"_id": 0, "updated_at": 0}
+            if not include_result:
+                projection["result"] = 0
+            return await asyncio.to_thread(collection.find_one, {"job_id": job_id}, projection)
+
+        except Exception as e:
+            logger.warning(f"작업 상태 조회 실패 ({job_id}): {e}")
+            return None
+
+    async def list(self, limit: int = 200) -> List[Dict[str, Any]]:
+        """최근 작업 목록 (결과 제외)"""
+        try:
+            collection = await self._get_collection()
+            cursor = collection.find({}, {"_id": 0, "updated_at": 0, "result": 0}).sort("created_at", -1).limit(limit)
+            return await asyncio.to_thread(list, cursor)
+
+        except Exception as e:
+            logger.warning(f"작업 목록 조회 실패: {e}")
+            return []
+
+
+# 전역 인스턴스
+job_store = JobStore()
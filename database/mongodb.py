@@ -22,8 +22,8 @@ class MongoDB:
                     cls._instance = cls._create_client()
                     logger.info("새로운 MongoDB 연결이 생성되었습니다.")
 
-        # 연결 상태 확인 및 재연결
-        if not cls._is_connected():
+        # 연결 상태 확인 및 재연결 (ping은 이벤트 루프를 막지 않도록 스레드에서 실행)
+        if not await asyncio.to_thread(cls._is_connected):
             async with cls._lock:
                 logger.warning("MongoDB 연결이 끊어졌습니다. 재연결을 시도합니다.")
                 if cls._instance:
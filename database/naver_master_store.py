@@ -0,0 +1,124 @@
+from configs.naver_config import naver_master_config
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+import pandas as pd
+import asyncio, io, json, logging, os
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷을 저장할 GCS 버킷 / 경로 (인스턴스가 바뀌어도 유지되도록 로컬 디스크 대신 GCS 사용)
+NAVER_MASTER_STORE_BUCKET = os.getenv("NAVER_MASTER_STORE_BUCKET", os.getenv("GCS_BUCKET_NAME", "blorange"))
+NAVER_MASTER_STORE_PREFIX = os.getenv("NAVER_MASTER_STORE_PREFIX", "naver_master_store")
+NAVER_MASTER_FULL_REFRESH_DAYS = int(os.getenv("NAVER_MASTER_FULL_REFRESH_DAYS", "7"))
+
+
+class NaverMasterStore:
+    """
+    네이버 마스터 리포트 저장소 (customer_id 단위)
+    마지막 전체 스냅샷을 GCS에 보관하고, 이후에는 fromTime 이후 변경분만 병합
+    직렬화 / 업로드 / 다운로드는 이벤트 루프를 막지 않도록 스레드에서 실행
+    """
+
+    # 같은 고객 / 마스터에 대한 동시 동기화 방지
+    _locks: Dict[str, asyncio.Lock] = {}
+
+    def __init__(self, customer_id: str, gcs_client=None):
+        self.customer_id = str(customer_id)
+        self.prefix = f"{NAVER_MASTER_STORE_PREFIX}/{self.customer_id}"
+        self._gcs = gcs_client
+
+    def _get_gcs(self):
+        # GCP 인증 정보가 필요하므로 실제로 사용할 때 생성
+        if self._gcs is None:
+            from auth.google_auth_manager import get_gcs_client
+            self._gcs = get_gcs_client(NAVER_MASTER_STORE_BUCKET)
+        return self._gcs
+
+    def lock(self, master_type: str) -> asyncio.Lock:
+        key = f"{self.customer_id}:{master_type}"
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        return self._locks[key]
+
+    def _snapshot_blob(self, master_type: str) -> str:
+        return f"{self.prefix}/{master_type}.pkl"
+
+    def _meta_blob(self, master_type: str) -> str:
+        # 마스터별로 따로 저장 (여러 마스터를 동시에 동기화해도 서로 덮어쓰지 않음)
+        return f"{self.prefix}/{master_type}.json"
+
+    async def get_info(self, master_type: str) -> dict:
+        """동기화 정보 반환 {last_sync, last_full_sync, rows} (없거나 읽을 수 없으면 빈 dict)"""
+        try:
+            content = await self._get_gcs().read_bytes(self._meta_blob(master_type))
+            return json.loads(content) if content else {}
+        except Exception as e:
+            logger.warning(f"{master_type} 마스터 저장소 정보 읽기 실패: {e}")
+            return {}
+
+    @staticmethod
+    def get_last_sync(info: dict) -> Optional[datetime]:
+        return datetime.fromisoformat(info["last_sync"]) if info else None
+
+    @staticmethod
+    def needs_full_refresh(info: dict) -> bool:
+        """전체 스냅샷이 없거나 재생성 주기가 지났는지 확인"""
+        if not info:
+            return True
+
+        last_full_sync = datetime.fromisoformat(info["last_full_sync"])
+        return datetime.now(timezone.utc) - last_full_sync >= timedelta(days=NAVER_MASTER_FULL_REFRESH_DAYS)
+
+    async def load(self, master_type: str) -> Optional[pd.DataFrame]:
+        """저장된 스냅샷 반환 (없거나 읽을 수 없으면 None)"""
+        blob_name = self._snapshot_blob(master_type)
+
+        try:
+            content = await self._get_gcs().read_bytes(blob_name)
+            if content is None:
+                return None
+            return await asyncio.to_thread(pd.read_pickle, io.BytesIO(content))
+
+        except Exception as e:
+            logger.warning(f"마스터 스냅샷 읽기 실패: {blob_name}, 에러: {e}")
+            return None
+
+    async def save(self, master_type: str, df: pd.DataFrame, synced_at: datetime, full: bool, info: dict):
+        """스냅샷 저장 후 동기화 정보 갱신 (정보는 스냅샷 저장이 끝난 뒤에만 기록)"""
+        gcs = self._get_gcs()
+
+        def serialize() -> bytes:
+            buffer = io.BytesIO()
+            df.to_pickle(buffer)
+            return buffer.getvalue()
+
+        await gcs.write_bytes(await asyncio.to_thread(serialize), self._snapshot_blob(master_type))
+
+        info = dict(info)
+        info["last_sync"] = synced_at.isoformat()
+        if full or "last_full_sync" not in info:
+            info["last_full_sync"] = synced_at.isoformat()
+        info["rows"] = len(df)
+
+        await gcs.write_bytes(json.dumps(info).encode("utf-8"), self._meta_blob(master_type), "application/json")
+
+    def apply_delta(self, master_type: str, snapshot: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+        """변경분을 ID 기준으로 스냅샷에 덮어쓰기 (삭제된 항목도 이름 조회를 위해 유지)"""
+        if delta.empty:
+            return snapshot
+
+        id_field = naver_master_config[master_type]["id"]
+        merged = pd.concat([snapshot, delta], ignore_index=True)
+        merged = merged.drop_duplicates(subset=[id_field], keep="last").reset_index(drop=True)
+
+        logger.info(f"{master_type} 변경분 {len(delta)}건 병합 (전체 {len(merged)}건)")
+        return merged
+
+    @staticmethod
+    def drop_deleted(df: pd.DataFrame) -> pd.DataFrame:
+        """삭제 시각(delTm)이 있는 항목 제외 (마스터 데이터 내보내기용)"""
+        if "delTm" not in df.columns:
+            return df
+
+        is_deleted = df["delTm"].notna() & (df["delTm"].astype(str).str.strip() != "")
+        return df[~is_deleted].reset_index(drop=True)
@@ -1,9 +1,11 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routers import reports, token, csv_upload, tools, search_database, auth
+from routers import reports, token, csv_upload, tools, search_database, auth, jobs
 from utils.http_client_manager import cleanup_http_client
 from utils.bigquery_client_manager import cleanup_all_bigquery_clients
+from utils.ga4_client_manager import cleanup_ga4_async_clients
 from database.mongodb import MongoDB
+from services.job_manager import job_manager
 import logging
 from contextlib import asynccontextmanager
 
@@ -14,8 +16,10 @@ async def lifespan(app: FastAPI):
     # 애플리케이션 시작 시
     yield
     # 애플리케이션 종료 시 리소스 정리
+    await job_manager.shutdown()
     await cleanup_http_client()
     await cleanup_all_bigquery_clients()
+    await cleanup_ga4_async_clients()
     await MongoDB.close()
 
 app = FastAPI(lifespan=lifespan)
@@ -35,6 +39,7 @@ app.include_router(csv_upload.router)
 app.include_router(tools.router)
 app.include_router(search_database.router)
 app.include_router(auth.router)
+app.include_router(jobs.router)
 
 @app.get("/")
 async def hello():
@@ -11,6 +11,10 @@ class MediaRequestModel(BaseModel):
 class MediaBudgetRequestModel(MediaRequestModel):
     type: str
 
+class MediaBackfillRequestModel(MediaRequestModel):
+    start_date: str  # YYYY-MM-DD
+    end_date: str  # YYYY-MM-DD
+
 class GFATokenRequestModel(BaseModel):
     code : str
     state : str
\ No newline at end of file
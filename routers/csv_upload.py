@@ -4,6 +4,7 @@ from services.csv_service import CSVService
 from auth.google_auth_manager import get_bigquery_client, get_gcs_client
 from models.bigquery_schemas import imweb_inner_data_schema, hanssem_insight_schema
 from services.data_processor import DataProcessor
+from services.job_manager import job_stage
 import logging
 import os
 
@@ -79,6 +80,34 @@ async def request_upload_url(filename: str = Form(...)):
         )
 
 
+async def run_uploaded_file_process(blob_name: str) -> dict:
+    """GCS에 업로드된 imweb 내부 데이터 CSV를 BigQuery에 로드 (라우터 / 작업 공용)"""
+    DATASET_ID = "imweb"
+    TABLE_ID = "INNER_data"
+
+    # BigQuery 및 GCS 클라이언트 초기화
+    bigquery_client = get_bigquery_client()
+    gcs_client = get_gcs_client(GCS_BUCKET_NAME)
+    csv_service = CSVService(bigquery_client, gcs_client)
+
+    # IMWEB 스키마 가져오기
+    schema = imweb_inner_data_schema()
+
+    # GCS에서 파일 처리
+    async with job_stage("process") as stage:
+        result = await csv_service.gcs_file_to_bigquery(
+            dataset_id=DATASET_ID,
+            table_id=TABLE_ID,
+            blob_name=blob_name,
+            schema=schema,
+            truncate=True,
+            processor_func=DataProcessor.process_imweb_inner_data
+        )
+        stage["rows"] = result.get("cleaned_rows")
+
+    return result
+
+
 @router.post("/upload/process-uploaded-file")
 async def process_uploaded_file(blob_name: str = Form(...)):
     """
@@ -93,29 +122,10 @@ async def process_uploaded_file(blob_name: str = Form(...)):
     Returns:
         업로드 결과
     """
-    DATASET_ID = "imweb"
-    TABLE_ID = "INNER_data"
-
     try:
         logger.info(f"GCS 업로드된 파일 처리 시작: {blob_name}")
 
-        # BigQuery 및 GCS 클라이언트 초기화
-        bigquery_client = get_bigquery_client()
-        gcs_client = get_gcs_client(GCS_BUCKET_NAME)
-        csv_service = CSVService(bigquery_client, gcs_client)
-
-        # IMWEB 스키마 가져오기
-        schema = imweb_inner_data_schema()
-
-        # GCS에서 파일 처리
-        result = await csv_service.gcs_file_to_bigquery(
-            dataset_id=DATASET_ID,
-            table_id=TABLE_ID,
-            blob_name=blob_name,
-            schema=schema,
-            truncate=True,
-            processor_func=DataProcessor.process_imweb_inner_data
-        )
+        result = await run_uploaded_file_process(blob_name)
 
         return JSONResponse(
             status_code=status.HTTP_200_OK,
@@ -0,0 +1,122 @@
+from fastapi import APIRouter, Form, HTTPException, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from models.media_request_models import TotalRequestModel, MediaRequestModel
+from routers.reports import create_all_report, media_config
+from routers.csv_upload import run_uploaded_file_process
+from services.job_manager import job_manager
+from database.job_store import job_store
+import json, logging
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def _accepted(job):
+    """작업 등록 응답 (작업 ID 즉시 반환)"""
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=job.to_dict(include_result=False),
+    )
+
+
+@router.post("/reports/all")
+async def submit_all_report(request: TotalRequestModel):
+    """/reports/all 을 백그라운드 작업으로 실행"""
+    job = job_manager.submit(
+        "reports/all",
+        lambda: create_all_report(request),
+        params={"customers": request.customers},
+    )
+    return _accepted(job)
+
+
+@router.post("/reports/{media}")
+async def submit_media_report(media: str, request: MediaRequestModel):
+    """매체별 리포트 수집을 백그라운드 작업으로 실행 (naver, gfa, kakao, meta ...)"""
+    if media not in media_config:
+        raise HTTPException(status_code=404, detail=f"지원하지 않는 매체입니다: {media}")
+
+    config = media_config[media]
+    request_model = config["model_class"](customer=request.customer)
+    job = job_manager.submit(
+        f"reports/{media}",
+        lambda: config["handler"](request_model),
+        params={"customer": request.customer, "media": media},
+    )
+    return _accepted(job)
+
+
+@router.post("/csv/process-uploaded-file")
+async def submit_uploaded_file_process(blob_name: str = Form(...)):
+    """GCS 업로드 파일 처리를 백그라운드 작업으로 실행"""
+    job = job_manager.submit(
+        "csv/process-uploaded-file",
+        lambda: run_uploaded_file_process(blob_name),
+        params={"blob_name": blob_name},
+    )
+    return _accepted(job)
+
+
+@router.get("")
+async def list_jobs():
+    """작업 목록 조회 (결과 제외, 다른 인스턴스에서 실행된 작업 포함)"""
+    jobs = {job.id: job.to_dict(include_result=False) for job in job_manager.list()}
+    for stored in await job_store.list():
+        jobs.setdefault(stored["job_id"], stored)
+
+    return sorted(jobs.values(), key=lambda job: job["created_at"], reverse=True)
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """작업 상태 / 단계별 소요 시간 / 행 수 / 결과 조회"""
+    job = job_manager.get(job_id)
+    if job is not None:
+        return job.to_dict()
+
+    # 다른 인스턴스에서 실행된 작업은 저장된 상태 반환
+    stored = await job_store.get(job_id)
+    if stored is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    return stored
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """작업 진행 이벤트 스트리밍 (Server-Sent Events)"""
+    job = job_manager.get(job_id)
+    if job is None:
+        # 다른 인스턴스에서 실행 중인 작업은 이벤트를 받을 수 없으므로 저장된 상태만 한 번 전송
+        stored = await job_store.get(job_id, include_result=False)
+        if stored is None:
+            raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+        async def stored_stream():
+            payload = json.dumps(stored, ensure_ascii=False, default=str)
+            yield f"event: snapshot\ndata: {payload}\n\n"
+
+        return StreamingResponse(stored_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+    async def event_stream():
+        async for event in job.subscribe():
+            payload = json.dumps({**event["data"], "time": event["time"]}, ensure_ascii=False, default=str)
+            yield f"event: {event['event']}\ndata: {payload}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    """실행 중인 작업 취소"""
+    job = await job_manager.cancel(job_id)
+    if job is None:
+        if await job_store.get(job_id, include_result=False) is not None:
+            raise HTTPException(status_code=409, detail="다른 인스턴스에서 실행된 작업은 취소할 수 없습니다")
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    return job.to_dict(include_result=False)
@@ -19,6 +19,7 @@ from .tiktok import router as tiktok_router
 from .mail import router as mail_router
 
 from configs.customers_event import bo_customers
+from services.report_executor import ReportExecutor
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -30,65 +31,62 @@ router.include_router(meta_router)
 router.include_router(tiktok_router)
 router.include_router(mail_router)
 
+media_config = {
+    "naver": {
+        "model_class": MediaRequestModel,
+        "handler": create_naver_reports,
+    },
+    "gfa": {
+        "model_class": MediaRequestModel,
+        "handler": create_gfa_reports,
+    },
+    "kakao": {
+        "model_class": MediaRequestModel,
+        "handler": create_kakao_reports,
+    },
+    "kakao_moment": {
+        "model_class": MediaRequestModel,
+        "handler": create_kakao_monent_reports,
+    },
+    "google_ads": {
+        "model_class": MediaRequestModel,
+        "handler": create_google_report,
+    },
+    "ga4": {"model_class": MediaRequestModel, 
+            "handler": create_ga4_report
+    },
+    "meta": {
+        "model_class": MediaRequestModel,
+        "handler": create_meta_reports
+    },
+    "criteo": {
+        "model_class": MediaRequestModel,
+        "handler": read_mails
+    },
+    "tiktok": {
+        "model_class": MediaRequestModel,
+        "handler": create_tiktok_reports
+    }
+}
+
 @router.post("/all")
 async def create_all_report(request: TotalRequestModel):
     try:
-        media_config = {
-            "naver": {
-                "model_class": MediaRequestModel,
-                "handler": create_naver_reports,
-            },
-            "gfa": {
-                "model_class": MediaRequestModel,
-                "handler": create_gfa_reports,
-            },
-            "kakao": {
-                "model_class": MediaRequestModel,
-                "handler": create_kakao_reports,
-            },
-            "kakao_moment": {
-                "model_class": MediaRequestModel,
-                "handler": create_kakao_monent_reports,
-            },
-            "google_ads": {
-                "model_class": MediaRequestModel,
-                "handler": create_google_report,
-            },
-            "ga4": {"model_class": MediaRequestModel, 
-                    "handler": create_ga4_report
-            },
-            "meta": {
-                "model_class": MediaRequestModel,
-                "handler": create_meta_reports
-            },
-            "criteo": {
-                "model_class": MediaRequestModel,
-                "handler": read_mails
-            },
-            "tiktok": {
-                "model_class": MediaRequestModel,
-                "handler": create_tiktok_reports
-            }
+        media_lists = {
+            customer: list(bo_customers[customer]["media_list"].keys())
+            for customer in request.customers
         }
-        result = {}
-
-        for customer in request.customers:
-            result[customer] = {}
-
-            for media in bo_customers[customer]["media_list"].keys():    
-                if media in media_config:
-                    platform_data = {"customer": customer}
-                    # 매체별 처리
-                    config = media_config[media]
-                    request_model = config["model_class"](**platform_data)
-                    response = await config["handler"](request_model)
 
-                else:
-                    response = "지원하지 않는 매체입니다."
+        # 전체 (고객사, 매체) 핸들러 동시 실행 - 전역 / 매체별 동시 실행 수 제한
+        executor = ReportExecutor(media_config)
+        response = await executor.run(request.customers, media_lists)
 
-                result[customer][media] = response
-
-        return {"status": "success", "message": result}
+        return {
+            "status": "success",
+            "message": response["result"],
+            "timing": response["timing"],
+            "elapsed": response["elapsed"],
+        }
 
     except Exception as e:
         return {"status": "error", "message": str(e)}
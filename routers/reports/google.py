@@ -5,6 +5,7 @@ from services.ga4_service import GA4ReportServices
 from services.bigquery_insert_service import BigQueryReportService
 from auth.google_auth_manager import get_google_ads_client, get_ga4_client, get_bigquery_client
 from configs.customers_event import bo_customers
+from services.job_manager import job_stage, count_rows
 import logging
 
 
@@ -32,12 +33,17 @@ async def create_google_report(request: MediaRequestModel):
         # BigQuery로 보내기
         results = {}
         for report_type, data in navigation_reports.items():
-            response = service.create_reports(data, report_type)
-            if "map" in report_type:
-                result = await bigquery_service.insert_daynamic_schema_without_date(data_set_name, response, truncate=True)
+            async with job_stage(f"{report_type}/fetch") as stage:
+                response = service.create_reports(data, report_type)
+                stage["rows"] = count_rows(response)
 
-            else:
-                result = await bigquery_service.insert_daynamic_schema(data_set_name, response)
+            async with job_stage(f"{report_type}/load") as stage:
+                if "map" in report_type:
+                    result = await bigquery_service.insert_daynamic_schema_without_date(data_set_name, response, truncate=True)
+
+                else:
+                    result = await bigquery_service.insert_daynamic_schema(data_set_name, response)
+                stage["rows"] = count_rows(response)
             results.update(result)
 
         return results
@@ -62,13 +68,31 @@ async def create_ga4_report(request: MediaRequestModel):
         bigquery_client = get_bigquery_client()
         bigquery_service = BigQueryReportService(bigquery_client)
 
-        # BigQuery로 보내기
+        # 같은 속성의 리포트는 batchRunReports로 함께 조회 (지문이 바뀐 날짜만 반환)
+        async with job_stage("fetch") as stage:
+            reports, fingerprints = await service.create_incremental_reports(navigation_reports, data_set_name)
+            stage["rows"] = sum(count_rows(response) for response in reports.values())
+
+        # BigQuery로 보내기 (변경된 날짜만 교체)
         results = {}
-        for report_type, data in navigation_reports.items():
-            response = service.create_report(data, report_type)
-            result = await bigquery_service.insert_daynamic_schema(data_set_name, response)
+        for report_type, response in reports.items():
+            if not fingerprints[report_type]:
+                logger.info(f"GA4_{report_type}: 변경된 날짜 없음")
+                results[f"GA4_{report_type}"] = "unchanged"
+                continue
+
+            async with job_stage(f"{report_type}/load") as stage:
+                # 데이터가 사라진 날짜(행 0개 지문)도 함께 교체되어 삭제됨
+                result = await bigquery_service.insert_daynamic_schema(
+                    data_set_name, response, replace_dates=True, dates=set(fingerprints[report_type])
+                )
+                stage["rows"] = count_rows(response)
             results.update(result)
 
+            # 적재에 성공한 경우에만 지문 저장 (실패 시 다음 실행에서 다시 적재)
+            if result.get(f"GA4_{report_type}") is True:
+                await service.save_fingerprints(data_set_name, report_type, fingerprints[report_type])
+
         return results
 
     except Exception as e:
@@ -79,7 +103,7 @@ async def get_ga4_list():
     try:
         client = get_ga4_client(None)
         service = GA4ReportServices(client)
-        response = service.properties_list()
+        response = await service.properties_list()
         return response
     
     except Exception as e:
@@ -94,7 +118,7 @@ async def get_ga4_events(request: MediaRequestModel):
         client = get_ga4_client(property_id)
         service = GA4ReportServices(client)
 
-        response = service.get_metadata()
+        response = await service.get_metadata()
         return response
 
     except Exception as e:
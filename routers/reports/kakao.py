@@ -5,6 +5,7 @@ from auth.kakao_token_manager import KakaoTokenManager
 from services.bigquery_insert_service import BigQueryReportService
 from auth.google_auth_manager import get_bigquery_client
 from configs.customers_event import bo_customers
+from services.job_manager import job_stage, count_rows
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,14 +23,18 @@ async def create_kakao_reports(request: MediaRequestModel):
         vaild_token = await token_manager.get_vaild_token()
 
         service = KakaoReportService(vaild_token, account_id)
-        response = await service.create_report()
+        async with job_stage("fetch") as stage:
+            response = await service.create_report()
+            stage["rows"] = count_rows(response)
 
         # BigQuery 연결
         bigquery_client = get_bigquery_client()
         bigquery_service = BigQueryReportService(bigquery_client)
 
         # 데이터셋, 테이블 생성 후 삽입 (없으면 자동 생성)
-        result = await bigquery_service.insert_static_schema(data_set_name, response)
+        async with job_stage("load") as stage:
+            result = await bigquery_service.insert_static_schema(data_set_name, response)
+            stage["rows"] = count_rows(response)
 
         return result
 
@@ -49,13 +54,17 @@ async def create_kakao_monent_reports(request: MediaRequestModel):
         valid_token = await token_manager.get_vaild_token()
 
         service = KakaoReportService(valid_token, account_id)
-        response = await service.create_moment_report()
+        async with job_stage("fetch") as stage:
+            response = await service.create_moment_report()
+            stage["rows"] = count_rows(response)
 
         # BigQuery 연결
         bigquery_client = get_bigquery_client()
         bigquery_service = BigQueryReportService(bigquery_client)
 
-        result = await bigquery_service.insert_static_schema(data_set_name, response)
+        async with job_stage("load") as stage:
+            result = await bigquery_service.insert_static_schema(data_set_name, response)
+            stage["rows"] = count_rows(response)
 
         return result
 
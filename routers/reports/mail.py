@@ -8,6 +8,7 @@ from services import send_report
 from datetime import datetime, timedelta
 from configs.customers_event import bo_customers
 from configs.customer_manager import customer_manager
+from services.job_manager import job_stage, count_rows
 import pandas as pd
 import io, base64
 import logging
@@ -30,16 +31,20 @@ async def read_mails(request: MediaRequestModel):
         service = WorksService(access_token)
 
         # 메일함에서 읽어오기
-        response = await service.read_mails(folder, report_name, field_names)
+        async with job_stage("fetch") as stage:
+            response = await service.read_mails(folder, report_name, field_names)
 
-        data = {"CRITEO": response["data"]}
-        delete_mail_ids = response["mail_ids"]
+            data = {"CRITEO": response["data"]}
+            delete_mail_ids = response["mail_ids"]
+            stage["rows"] = count_rows(data)
 
         # BigQuery 연결
         bigquery_client = get_bigquery_client()
         bigquery_service = BigQueryReportService(bigquery_client)
 
-        result = await bigquery_service.insert_daynamic_schema(data_set_name, data)
+        async with job_stage("load") as stage:
+            result = await bigquery_service.insert_daynamic_schema(data_set_name, data)
+            stage["rows"] = count_rows(data)
 
         await service.delete_mails(delete_mail_ids)
         return result
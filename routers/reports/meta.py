@@ -1,16 +1,35 @@
 from fastapi import APIRouter
 from services.meta_service import MetaAdsReportServices
-from auth.meta_auth_manager import get_meta_ads_client
-from models.media_request_models import MediaRequestModel
+from auth.meta_auth_manager import get_meta_ads_client, get_meta_graph_batcher
+from models.media_request_models import MediaRequestModel, MediaBackfillRequestModel
 from auth.google_auth_manager import get_bigquery_client
 from services.bigquery_insert_service import BigQueryReportService
 from configs.customers_event import bo_customers
-import logging
+from services.job_manager import job_stage, count_rows
+from datetime import datetime
+import asyncio, logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/meta", tags=["reports"])
 
+
+def _create_services(customer_info, use_batch=False):
+    """광고 계정별 서비스 생성 (계정이 여러 개면 Graph API 배치 처리기 공유)"""
+    account_ids = customer_info["account_id"]
+    if not isinstance(account_ids, list):
+        account_ids = [account_ids]
+
+    batcher = get_meta_graph_batcher() if use_batch or len(account_ids) > 1 else None
+    return [MetaAdsReportServices(get_meta_ads_client(account_id, batcher)) for account_id in account_ids]
+
+
+async def _create_reports(services, fields, *args, **kwargs):
+    """계정별 리포트를 동시에 조회 후 하나의 META 테이블 데이터로 병합"""
+    responses = await asyncio.gather(*(service.create_reports(fields, *args, **kwargs) for service in services))
+    return {"META": [row for response in responses for row in response["META"]]}
+
+
 @router.post("/")
 async def create_meta_reports(request: MediaRequestModel):
     try:
@@ -18,21 +37,77 @@ async def create_meta_reports(request: MediaRequestModel):
         customer_info = bo_customers[customer]["media_list"]["meta"]
         data_set_name = bo_customers[customer]["data_set_name"]
 
-        account_id = customer_info["account_id"]
-        
-        client = get_meta_ads_client(account_id)
-        service = MetaAdsReportServices(client)
+        services = _create_services(customer_info)
 
         fields = customer_info["fields"]
-        response = await service.create_reports(fields)
+        async with job_stage("fetch") as stage:
+            response = await _create_reports(services, fields)
+            stage["rows"] = count_rows(response)
         
         # BigQuery 연결
         bigquery_client = get_bigquery_client()
         bigquery_service = BigQueryReportService(bigquery_client)
 
-        result = await bigquery_service.insert_daynamic_schema(data_set_name, response)
+        async with job_stage("load") as stage:
+            result = await bigquery_service.insert_daynamic_schema(data_set_name, response)
+            stage["rows"] = count_rows(response)
 
         return result
     
     except Exception as e:
-        return {"status": "error", "message": str(e)}
\ No newline at end of file
+        return {"status": "error", "message": str(e)}
+
+@router.post("/backfill")
+async def create_meta_backfill_reports(request: MediaBackfillRequestModel):
+    """기간 일별 성과를 한 번에 조회 후 해당 날짜만 교체"""
+    try:
+        customer = request.customer
+        customer_info = bo_customers[customer]["media_list"]["meta"]
+        data_set_name = bo_customers[customer]["data_set_name"]
+
+        start_date, end_date = request.start_date, request.end_date
+        if datetime.strptime(start_date, "%Y-%m-%d") > datetime.strptime(end_date, "%Y-%m-%d"):
+            raise ValueError("start_date는 end_date보다 이후일 수 없습니다")
+
+        services = _create_services(customer_info)
+
+        # 일별 행 구분을 위해 date_start 필수
+        fields = customer_info["fields"]
+        if "date_start" not in fields:
+            fields = ["date_start"] + fields
+
+        async with job_stage("fetch") as stage:
+            response = await _create_reports(services, fields, start_date, end_date, time_increment=1, raise_errors=True)
+            stage["rows"] = count_rows(response)
+
+        # BigQuery 연결
+        bigquery_client = get_bigquery_client()
+        bigquery_service = BigQueryReportService(bigquery_client)
+
+        async with job_stage("load") as stage:
+            result = await bigquery_service.insert_daynamic_schema(data_set_name, response, replace_dates=True)
+            stage["rows"] = count_rows(response)
+
+        # 적재 실패는 결과 값(False)으로만 남으므로 백필은 실패로 반환
+        if count_rows(response) and result.get("META") is False:
+            raise Exception(f"META 백필 적재 실패 ({start_date} ~ {end_date}), 기존 데이터는 유지됨")
+
+        return result
+
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@router.post("/overview")
+async def get_meta_account_overview(request: MediaRequestModel):
+    """광고 계정별 권한 확인 / 캠페인 목표 조회 (배치 요청)"""
+    try:
+        customer = request.customer
+        customer_info = bo_customers[customer]["media_list"]["meta"]
+
+        services = _create_services(customer_info, use_batch=True)
+        result = await asyncio.gather(*(service.get_account_overview() for service in services))
+
+        return {"status": "success", "data": result}
+
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
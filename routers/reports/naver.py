@@ -7,6 +7,7 @@ from auth.naver_auth_manager import get_naver_client, get_gfa_client
 from services.bigquery_insert_service import BigQueryReportService
 from auth.google_auth_manager import get_bigquery_client
 from configs.customers_event import bo_customers
+from services.job_manager import job_stage, count_rows
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,13 +29,17 @@ async def create_naver_reports(request: MediaRequestModel):
         client = get_naver_client(customer_id)
         service = NaverReportService(client)
 
-        response = await service.create_complete_report(master_list, stat_types)
+        async with job_stage("fetch") as stage:
+            response = await service.create_complete_report(master_list, stat_types)
+            stage["rows"] = count_rows(response)
         
         # BigQuery 연결
         bigquery_client = get_bigquery_client()
         bigquery_service = BigQueryReportService(bigquery_client)
 
-        result = await bigquery_service.insert_daynamic_schema(data_set_name, response)
+        async with job_stage("load") as stage:
+            result = await bigquery_service.insert_daynamic_schema(data_set_name, response)
+            stage["rows"] = count_rows(response)
 
         return result
 
@@ -56,16 +61,20 @@ async def create_naver_master_reports(request: MediaRequestModel):
         service = NaverReportService(client)
 
         # 1. 마스터 데이터만 가져오기
-        response = await service.get_master_data_only(master_list)
+        async with job_stage("fetch") as stage:
+            response = await service.get_master_data_only(master_list)
+            stage["rows"] = count_rows(response)
         
         # 2. BigQuery 연결
         bigquery_client = get_bigquery_client()
         bigquery_service = BigQueryReportService(bigquery_client)
 
         # 3. BigQuery에 저장 (기존 데이터 교체 - truncate=True)
-        result = await bigquery_service.insert_daynamic_schema_without_date(
-            data_set_name, response, truncate=True
-        )
+        async with job_stage("load") as stage:
+            result = await bigquery_service.insert_daynamic_schema_without_date(
+                data_set_name, response, truncate=True
+            )
+            stage["rows"] = count_rows(response)
 
         return result
 
@@ -88,7 +97,7 @@ async def adjust_gfa_budget(request: MediaBudgetRequestModel):
         service = GFAReportService(client)
 
         response = await service.adjust_budget(type=adjust_type)
-        return response
+        return {"status": "success", **response}
     
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -108,13 +117,17 @@ async def create_gfa_reports(request: MediaRequestModel):
 
         client = get_gfa_client(access_token, customer_id)
         service = GFAReportService(client)
-        response = await service.get_performance_data()
+        async with job_stage("fetch") as stage:
+            response = await service.get_performance_data()
+            stage["rows"] = count_rows(response)
         
         # BigQuery 연결
         bigquery_client = get_bigquery_client()
         bigquery_service = BigQueryReportService(bigquery_client)
 
-        result = await bigquery_service.insert_static_schema(data_set_name, response)
+        async with job_stage("load") as stage:
+            result = await bigquery_service.insert_static_schema(data_set_name, response)
+            stage["rows"] = count_rows(response)
 
         return result
 
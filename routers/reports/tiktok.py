@@ -5,6 +5,7 @@ from clients.tiktok_api_client import TikTokAPIClient
 from services.tiktok_service import TikTokReportService
 from auth.google_auth_manager import get_bigquery_client
 from services.bigquery_insert_service import BigQueryReportService
+from services.job_manager import job_stage, count_rows
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,13 +26,17 @@ async def create_tiktok_reports(request: MediaRequestModel):
         client = TikTokAPIClient(account_id)
         service = TikTokReportService(client)
 
-        response = await service.create_report(dimensions, metrics)
+        async with job_stage("fetch") as stage:
+            response = await service.create_report(dimensions, metrics)
+            stage["rows"] = count_rows(response)
         
         # BigQuery 연결
         bigquery_client = get_bigquery_client()
         bigquery_service = BigQueryReportService(bigquery_client)
 
-        result = await bigquery_service.insert_daynamic_schema(data_set_name, response)
+        async with job_stage("load") as stage:
+            result = await bigquery_service.insert_daynamic_schema(data_set_name, response)
+            stage["rows"] = count_rows(response)
 
         return result
     
@@ -19,6 +19,7 @@ from models.bigquery_schemas import (
     naver_keyword_master_schema,
     naver_shopping_product_master_schema,
 )
+import pandas as pd
 import logging, re
 
 logger = logging.getLogger(__name__)
@@ -58,11 +59,11 @@ class BigQueryReportService:
         for table_name, data in reports_data.items():
             result[table_name] = False
 
-            if data:  # 데이터가 있으면
+            if self._has_rows(data):  # 데이터가 있으면
                 try:
                     # 날짜 필드명 결정
                     date_field = 'segments_date' if "GOOGLE_ADS" in table_name else 'date'
-                    insert_date = data[0][date_field]
+                    insert_date = self._first_row(data)[date_field]
 
                     if await self.client.check_date_exists(data_set_name, table_name, insert_date, date_field):
                         logger.warning(f"{table_name}: 해당 날짜({insert_date})의 데이터가 이미 존재합니다. 삽입을 취소합니다.")
@@ -85,8 +86,12 @@ class BigQueryReportService:
 
         return result
 
-    async def insert_daynamic_schema(self, data_set_name: str, reports_data: dict) -> dict:
-        """동적 스키마를 가진 데이터를 BigQuery에 삽입"""
+    async def insert_daynamic_schema(self, data_set_name: str, reports_data: dict, replace_dates=False, dates=None) -> dict:
+        """
+        동적 스키마를 가진 데이터를 BigQuery에 삽입
+        replace_dates=True 이면 데이터에 포함된 날짜만 원자적으로 교체 (기간 백필 / GA4 변경 날짜 적재용)
+        dates: replace_dates=True 일 때 함께 교체할 날짜 (데이터에 없는 날짜는 삭제만 됨)
+        """
         result = {}
 
         await self.client.create_dataset(data_set_name)
@@ -116,15 +121,27 @@ class BigQueryReportService:
             schema = self._create_schema(basic_schema, data, existing_schema)
             result[table_name] = False
 
-            if data:  # 데이터가 있으면
+            if self._has_rows(data):  # 데이터가 있으면
                 try:
                     # 날짜 필드명 결정
                     date_field = 'segments_date' if "GOOGLE_ADS" in table_name else 'date'
 
+                    # 백필 / 변경된 날짜만 적재: 데이터에 있는 날짜를 스테이징 테이블 MERGE로 한 번에 교체
+                    if replace_dates:
+                        if len(schema) == 0:
+                            raise Exception(f"생성된 BigQuery 스키마가 없습니다")
+
+                        replaced = {date for date in self._column_values(data, date_field) if date} | set(dates or ())
+                        logger.info(f"{table_name}: {len(replaced)}일 데이터를 교체합니다.")
+                        await self.client.replace_dates(data_set_name, table_name, schema, data, replaced, date_field)
+                        result[table_name] = True
+                        logger.info(f"{table_name} 데이터 BigQuery 교체 완료")
+                        continue
+
                     # GA4 테이블인 경우: 날짜 범위로 삭제 후 삽입
                     if table_name.startswith("GA4"):
                         # 모든 날짜 추출 (리스트)
-                        all_dates = [row[date_field] for row in data if date_field in row]
+                        all_dates = self._column_values(data, date_field)
                         if all_dates:
                             start_date = min(all_dates)
                             end_date = max(all_dates)
@@ -133,7 +150,7 @@ class BigQueryReportService:
 
                     # 다른 테이블인 경우: 날짜 중복 체크 (첫 번째 날짜만 확인)
                     else:
-                        first_date = data[0][date_field]
+                        first_date = self._first_row(data)[date_field]
                         if await self.client.check_date_exists(data_set_name, table_name, first_date, date_field):
                             logger.warning(f"{table_name}: 해당 날짜({first_date})의 데이터가 이미 존재합니다. 삽입을 취소합니다.")
                             result[table_name] = "skipped_duplicate_date"
@@ -149,6 +166,18 @@ class BigQueryReportService:
                 except Exception as e:
                     logger.error(f"{table_name} BigQuery 삽입 실패: {str(e)}")
                     result[table_name] = False
+
+            # 교체할 날짜의 데이터가 모두 사라진 경우: 해당 날짜 삭제만 수행
+            elif replace_dates and dates:
+                try:
+                    date_field = 'segments_date' if "GOOGLE_ADS" in table_name else 'date'
+                    logger.info(f"{table_name}: 데이터가 없는 {len(dates)}일을 삭제합니다.")
+                    await self.client.delete_data_by_dates(data_set_name, table_name, set(dates), date_field)
+                    result[table_name] = True
+
+                except Exception as e:
+                    logger.error(f"{table_name} BigQuery 삭제 실패: {str(e)}")
+                    result[table_name] = False
             else:
                 logger.warning(f"{table_name} 데이터가 비어있음")
 
@@ -192,7 +221,7 @@ class BigQueryReportService:
             schema = self._create_schema(basic_schema, data, existing_schema)
             result[table_name] = False
 
-            if data:  # 데이터가 있으면
+            if self._has_rows(data):  # 데이터가 있으면
                 try:
                     if len(schema) == 0:
                         raise Exception(f"생성된 BigQuery 스키마가 없습니다")
@@ -209,10 +238,32 @@ class BigQueryReportService:
 
         return result
     
-    def _create_schema(self, basic_schema: dict, data: list, existing_schema=None):
-        if not data:
+    @staticmethod
+    def _has_rows(data) -> bool:
+        """행 리스트 / DataFrame 데이터 존재 여부"""
+        if isinstance(data, pd.DataFrame):
+            return not data.empty
+        return bool(data)
+
+    @staticmethod
+    def _first_row(data) -> dict:
+        if isinstance(data, pd.DataFrame):
+            return data.head(1).to_dict("records")[0]
+        return data[0]
+
+    @staticmethod
+    def _column_values(data, field) -> list:
+        if isinstance(data, pd.DataFrame):
+            return data[field].dropna().tolist() if field in data.columns else []
+        return [row[field] for row in data if field in row]
+
+    def _create_schema(self, basic_schema: dict, data, existing_schema=None):
+        """행 리스트 또는 DataFrame의 첫 행 기준으로 스키마 생성"""
+        if not self._has_rows(data):
             return []
 
+        first_row = self._first_row(data)
+
         schema_fields = []
         
         # 기존 필드 이름 목록 추출
@@ -220,7 +271,7 @@ class BigQueryReportService:
         if existing_schema and not isinstance(existing_schema, str):
             existing_field_names = [field.name for field in existing_schema]
 
-        for key in data[0]:
+        for key in first_row:
             # 기존 테이블이 존재한다면, 테이블에 이미 있는 필드만 스키마에 포함
             if existing_field_names is not None and key not in existing_field_names:
                 continue
@@ -231,7 +282,7 @@ class BigQueryReportService:
 
             else:
                 # 데이터 타입을 자동으로 추론
-                sample_value = data[0][key]
+                sample_value = first_row[key]
                 if isinstance(sample_value, int):
                     data_type = "INTEGER"
                 elif isinstance(sample_value, float):
@@ -0,0 +1,57 @@
+from google.analytics.data_v1beta.types import MetricType, RunReportResponse
+from utils.date_format import format_report_date
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+
+class GA4ReportDecoder:
+    """
+    GA4 RunReportResponse 컬럼 단위 변환기 (리포트별로 하나 사용)
+    dimension_headers / metric_headers(타입 포함)는 첫 페이지에서 한 번만 읽고,
+    페이지의 값을 컬럼별 배열로 바로 채워 DataFrame으로 반환
+    - 차원: 문자열 (date는 YYYY-MM-DD로 변환)
+    - 측정항목: TYPE_INTEGER -> int64, 그 외(TYPE_FLOAT, 통화, 시간 등) -> float64
+    """
+
+    INTEGER_TYPES = {MetricType.TYPE_INTEGER}
+
+    def __init__(self):
+        self.dimensions: Optional[List[str]] = None
+        self.metrics: Optional[List[str]] = None
+        self.metric_dtypes: Optional[List[type]] = None
+
+    def _read_headers(self, response):
+        self.dimensions = [header.name for header in response.dimension_headers]
+        self.metrics = [header.name for header in response.metric_headers]
+        self.metric_dtypes = [
+            np.int64 if header.type_ in self.INTEGER_TYPES else np.float64
+            for header in response.metric_headers
+        ]
+
+    def decode(self, response: RunReportResponse) -> pd.DataFrame:
+        """response 한 페이지 -> DataFrame"""
+        if self.dimensions is None:
+            self._read_headers(response)
+
+        # proto-plus 래퍼를 거치지 않도록 protobuf 메시지로 직접 접근
+        rows = RunReportResponse.pb(response).rows
+        columns = {}
+
+        for i, name in enumerate(self.dimensions):
+            values = np.array([row.dimension_values[i].value for row in rows], dtype=object)
+            columns[name] = format_report_date(values) if name == "date" else values
+
+        for i, (name, dtype) in enumerate(zip(self.metrics, self.metric_dtypes)):
+            values = np.array([row.metric_values[i].value for row in rows])
+            columns[name] = values.astype(dtype) if len(values) else np.empty(0, dtype=dtype)
+
+        return pd.DataFrame(columns, copy=False)
+
+    def concat(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """페이지별 DataFrame 합치기"""
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True, copy=False)
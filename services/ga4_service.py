@@ -1,55 +1,177 @@
 from clients.ga4_api_client import GA4APIClient
-import pandas as pd
-import logging
+from services.ga4_report_decoder import GA4ReportDecoder
+from database.ga4_fingerprint_store import GA4FingerprintStore
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+import logging, os, re
 
 logger = logging.getLogger(__name__)
 
+# GA4가 집계를 수정할 수 있는 최근 일수 (지문이 있으면 이 기간만 다시 조회)
+GA4_REVISION_DAYS = int(os.getenv("GA4_REVISION_DAYS", "3"))
+# 속성 시간대를 조회하지 못했을 때 사용할 시간대 (GA4의 yesterday는 속성 시간대 기준)
+GA4_DEFAULT_TIMEZONE = os.getenv("GA4_DEFAULT_TIMEZONE", "Asia/Seoul")
+
 class GA4ReportServices:
 
     def __init__(self, google_client: GA4APIClient):
         self.client = google_client
 
-    def create_report(self, data, report_type):
+    async def create_report(self, data, report_type):
+        decoder = GA4ReportDecoder()
+        frames = [frame async for frame in self.iter_report(data, decoder)]
+
+        return {f"GA4_{report_type}": decoder.concat(frames)}
+
+    async def iter_report(self, data, decoder=None):
+        """리포트를 페이지 단위 DataFrame으로 변환하여 반환 (async generator)"""
+        decoder = decoder or GA4ReportDecoder()
+
+        async for response in self.client.iter_report_pages(*self._report_definition(data)):
+            yield decoder.decode(response)
+
+    async def create_reports(self, reports):
+        """
+        같은 속성의 리포트 여러 개를 batchRunReports로 함께 조회
+        reports: {report_type: 리포트 설정}, 반환: {report_type: {GA4_<report_type>: DataFrame}}
+        """
+        definitions = {report_type: self._report_definition(data) for report_type, data in reports.items()}
+        decoders = {report_type: GA4ReportDecoder() for report_type in reports}
+        frames = {report_type: [] for report_type in reports}
+
+        async for report_type, response in self.client.iter_batch_report_pages(definitions):
+            frames[report_type].append(decoders[report_type].decode(response))
+
+        return {
+            report_type: {f"GA4_{report_type}": decoders[report_type].concat(frames[report_type])}
+            for report_type in reports
+        }
+
+    async def create_incremental_reports(self, reports, data_set_name):
+        """
+        일자별 지문을 기준으로 변경된 날짜만 반환
+        지문이 있는 테이블은 최근 GA4_REVISION_DAYS일(마지막 적재 이후 공백 포함)만 조회, 없으면 설정된 전체 기간 조회
+        조회 기간의 모든 날짜를 비교하므로, 이전에 적재됐지만 데이터가 사라진 날짜도 변경(행 0개)으로 반환
+        반환: ({report_type: {GA4_<report_type>: 변경된 날짜 DataFrame}}, {report_type: 변경된 날짜 지문})
+        """
+        stored = {
+            report_type: await GA4FingerprintStore(data_set_name, f"GA4_{report_type}").get_all()
+            for report_type in reports
+        }
+        today = await self._property_today()
+        windows = {
+            report_type: self._lookback_window(data.get("date_range", "7daysAgo"), stored[report_type], today)
+            for report_type, data in reports.items()
+        }
+        adjusted = {
+            report_type: {**data, "date_range": windows[report_type][0], "end_date": windows[report_type][1]}
+            for report_type, data in reports.items()
+        }
+
+        results = await self.create_reports(adjusted)
+
+        fingerprints = {}
+        for report_type, result in results.items():
+            table_name = f"GA4_{report_type}"
+            data_df = result[table_name]
+            current = self._fingerprint(data_df)
+
+            # 조회 기간 중 데이터가 없는 날짜: 저장된 지문이 있으면 빈 지문과 비교해 삭제 대상으로 포함
+            for day in self._window_dates(*windows[report_type]):
+                if day not in current and day in stored[report_type]:
+                    current[day] = {"rows": 0, "metrics": {}}
+
+            changed = {
+                day: fingerprint
+                for day, fingerprint in current.items()
+                if stored[report_type].get(day) != fingerprint
+            }
+            start, end = windows[report_type]
+            logger.info(f"{table_name}: 조회 {start}~{end}, 변경된 날짜 {len(changed)}일")
+
+            if len(data_df):
+                result[table_name] = data_df[data_df["date"].isin(changed)].reset_index(drop=True)
+            fingerprints[report_type] = changed
+
+        return results, fingerprints
+
+    async def save_fingerprints(self, data_set_name, report_type, fingerprints):
+        """적재가 끝난 날짜의 지문 저장"""
+        await GA4FingerprintStore(data_set_name, f"GA4_{report_type}").put_many(fingerprints)
+
+    async def _property_today(self):
+        """속성 시간대 기준 오늘 날짜 (서버 시간대(UTC)와 다르므로 GA4의 상대 날짜와 맞추기 위해 사용)"""
+        try:
+            timezone = await self.client.get_property_timezone() or GA4_DEFAULT_TIMEZONE
+        except Exception as e:
+            logger.warning(f"GA4 속성 시간대 조회 실패, {GA4_DEFAULT_TIMEZONE} 사용: {e}")
+            timezone = GA4_DEFAULT_TIMEZONE
+
+        return datetime.now(ZoneInfo(timezone)).date()
+
+    def _lookback_window(self, start, stored, today):
+        """
+        조회 기간 (start, end) 반환
+        지문이 있으면 최근 수정 가능 기간(+ 마지막 적재 이후 공백)만 조회하도록 시작일 조정
+        비교할 날짜와 실제 조회 기간이 일치하도록 상대 날짜(NdaysAgo / yesterday)는 속성 시간대 기준 YYYY-MM-DD로 변환
+        """
+        end = (today - timedelta(days=1)).isoformat()
+
+        match = re.fullmatch(r"(\d+)daysAgo", start)
+        if start == "yesterday":
+            days = 1
+        elif match:
+            days = int(match.group(1))
+        else:
+            # 그 외 형식(YYYY-MM-DD 등)은 그대로 조회
+            return start, end
+
+        if stored:
+            last_date = date.fromisoformat(max(stored))
+            days = min(days, max(GA4_REVISION_DAYS, (today - last_date).days - 1))
+
+        return (today - timedelta(days=days)).isoformat(), end
+
+    def _window_dates(self, start, end):
+        """조회 기간의 날짜 목록 (YYYY-MM-DD가 아니면 빈 목록)"""
+        try:
+            start_date, end_date = date.fromisoformat(start), date.fromisoformat(end)
+        except ValueError:
+            return []
+
+        return [(start_date + timedelta(days=i)).isoformat() for i in range((end_date - start_date).days + 1)]
+
+    def _fingerprint(self, data_df):
+        """일자별 행 수 + 측정항목 합계 {date: {"rows", "metrics"}}"""
+        if not len(data_df):
+            return {}
+
+        metrics = data_df.select_dtypes("number").columns
+        grouped = data_df.groupby("date", sort=False)
+        rows = grouped.size()
+        sums = grouped[list(metrics)].sum()
+
+        return {
+            day: {
+                "rows": int(rows[day]),
+                "metrics": {metric: round(float(value), 6) for metric, value in sums.loc[day].items()},
+            }
+            for day in rows.index
+        }
+
+    def _report_definition(self, data):
         defaults = data.get("default", [])
         metrics = data.get("metric", [])
         event_filters = data.get("filter", [])
         start = data.get("date_range", "7daysAgo")
-        
-        response = self.client.request_create_report(defaults, metrics, event_filters, start)
-        if event_filters:
-            dimensions = defaults + ["eventName"]
+        end = data.get("end_date", "yesterday")
+        return defaults, metrics, event_filters, start, end
 
-        else:
-            dimensions = defaults
-
-        data = []
-        for rows in response.rows:
-            result = {}
-            for row, header in zip(rows.dimension_values, dimensions):
-                result[header] = row.value
-
-            for row, metric in zip(rows.metric_values, metrics):
-                if "keyEvents" in metrics:
-                    result[metric] = float(row.value)
-
-                else:
-                    result[metric] = int(row.value)
-
-            data.append(result)
-        
-        data_df = pd.DataFrame(data)
-        data_df["date"] = pd.to_datetime(data_df["date"], format="%Y%m%d").dt.strftime(
-            "%Y-%m-%d"
-        )
-        data = data_df.to_dict("records")
-        results = {f"GA4_{report_type}": data}
-        return results
-
-    def properties_list(self):
-        property_list = self.client.properties_list()
+    async def properties_list(self):
+        property_list = await self.client.properties_list()
         return property_list
 
-    def get_metadata(self):
+    async def get_metadata(self):
         """사용가능한 차원과 측정항목 조회"""
-        metadata = self.client.get_metadata()
+        metadata = await self.client.get_metadata()
         return metadata
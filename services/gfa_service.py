@@ -1,13 +1,29 @@
 from clients.gfa_api_client import GFAAPIClient
+from database.entity_cache import EntityCache
+from utils.rate_limiter import get_rate_limiter
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
-import logging, asyncio
+import logging, asyncio, os
 
 logger = logging.getLogger(__name__)
 
+# GFA API 요청 제한 (초당 요청 수 / 동시 요청 수)
+GFA_RPS = float(os.getenv("GFA_RPS", "5"))
+GFA_CONCURRENCY = int(os.getenv("GFA_CONCURRENCY", "5"))
+# 캐시에 없는 ID가 이 수 이하면 단건 조회, 초과하면 전체 목록 조회
+GFA_TARGETED_LOOKUP_LIMIT = int(os.getenv("GFA_TARGETED_LOOKUP_LIMIT", "50"))
+# 예산 변경 1회 요청에 포함할 최대 광고그룹 수
+GFA_BUDGET_BATCH_SIZE = int(os.getenv("GFA_BUDGET_BATCH_SIZE", "50"))
+
 class GFAReportService:
+    # 단건 조회 API 경로
+    STRUCTURE_URIS = {"campaigns": "campaigns", "adsets": "adSets", "creatives": "creatives"}
+    MISSING = "-"
+
     def __init__(self, gfa_client: GFAAPIClient):
         self.client = gfa_client
+        self.limiter = get_rate_limiter("gfa", GFA_RPS, burst=GFA_CONCURRENCY, max_concurrency=GFA_CONCURRENCY)
+        self.entity_cache = EntityCache("gfa", gfa_client.account_no)
 
     async def get_performance_data(self):
         report = []
@@ -16,23 +32,21 @@ class GFAReportService:
         response = await self.client.get_performance(yesterday, yesterday)
         performance_data: List[Dict[str, Any]] = response.get("rows", [])
         
-        index = {"campaigns": {}, "adsets": {}, "creatives": {}}
-
-        for target in index:
-            logger.info(target)
-            structure_list = await self.get_ad_structure_list(target)
-            structure_info = {}
+        # 성과 데이터에 있는 ID만 이름 조회 (캐시 -> 단건 조회 / 전체 목록 순)
+        index = {"campaigns": "campaignNo", "adsets": "adSetNo", "creatives": "creativeNo"}
+        targets = list(index.items())
 
-            for structure in structure_list:
-                structure_id, structure_name = structure["no"], structure["name"]
-                structure_info[structure_id] = structure_name
-                
-            index[target] = structure_info
+        resolved = await asyncio.gather(
+            *(self._resolve_names(target, {data.get(id_field) for data in performance_data})
+              for target, id_field in targets)
+        )
+        index = {target: names for (target, _), names in zip(targets, resolved)}
         
+        # 조회되지 않은 ID는 "-"로 기록
         for data in performance_data:
-            data["campaign_name"] = index["campaigns"][data["campaignNo"]]
-            data["adset_name"] = index["adsets"][data["adSetNo"]]
-            data["creative_name"] = index["creatives"][data["creativeNo"]]
+            data["campaign_name"] = index["campaigns"].get(str(data.get("campaignNo")), self.MISSING)
+            data["adset_name"] = index["adsets"].get(str(data.get("adSetNo")), self.MISSING)
+            data["creative_name"] = index["creatives"].get(str(data.get("creativeNo")), self.MISSING)
             data["date"] = data.pop("targetDate")
             report.append(data)
         
@@ -41,7 +55,6 @@ class GFAReportService:
     
     async def adjust_budget(self, type: str):
         """ 예산을 변경합니다. IMWEB 한정 """
-        results = []
         # 캠페인 On인 리스트 생성
         # 그룹 리스트 On 반환 후 캠페인 On 리스트만 선별
 
@@ -61,37 +74,118 @@ class GFAReportService:
 
                 live_data[target].append(data)
         
-        total, success = 0,0
+        # 변경 금액별로 광고그룹을 묶어 배치 요청
+        targets = {}
         for adset in live_data["adsets"]:
             if adset["campaign_id"] in live_data["campaigns"]:
-                logger.info(adset)
-                total += 1
                 adjust_amount = adset["amount"] * 2 if type.upper() == "UP" else adset["amount"] / 2
-                response = await self.client.adjust_adset_budget(adset["adset_id"], adjust_amount)
-                await asyncio.sleep(0.5)
-                if response["success"]:
-                    success += 1
+                targets.setdefault(adjust_amount, []).append(adset)
+
+        batches = []
+        for adjust_amount, adsets in targets.items():
+            for i in range(0, len(adsets), GFA_BUDGET_BATCH_SIZE):
+                batches.append((adjust_amount, adsets[i : i + GFA_BUDGET_BATCH_SIZE]))
+
+        batch_results = await asyncio.gather(
+            *(self._adjust_budget_batch(adsets, adjust_amount) for adjust_amount, adsets in batches)
+        )
+        results = [result for batch_result in batch_results for result in batch_result]
+
+        total = len(results)
+        changed = [result["adset_id"] for result in results if result["success"]]
+
+        # 변경된 광고그룹은 캐시에서 제거
+        if changed:
+            await self.entity_cache.invalidate("adsets", changed)
         
-        return f"{success}/{total} 예산 변경 완료"
+        return {"message": f"{len(changed)}/{total} 예산 변경 완료", "results": results}
+
+    async def _adjust_budget_batch(self, adsets: List[Dict[str, Any]], adjust_amount: float):
+        """같은 금액으로 변경할 광고그룹 일괄 변경 (배치 실패 시 광고그룹별로 재시도)"""
+        async with self.limiter:
+            response = await self.client.adjust_adsets_budget([adset["adset_id"] for adset in adsets], adjust_amount)
+
+        # 요청 내용이 거부된 경우(429 이외의 4xx / success=false)만 광고그룹별로 재시도
+        # 서버 / 네트워크 오류, 요청 제한은 나눠서 보내도 같은 결과이므로 그대로 실패 처리
+        status_code = response.get("status_code") or 0
+        rejected = response.get("status") != "error" or (400 <= status_code < 500 and status_code != 429)
+        if not response.get("success") and rejected and len(adsets) > 1:
+            logger.warning(f"예산 일괄 변경 실패, 광고그룹별 재시도 ({len(adsets)}건): {response.get('message')}")
+            retried = await asyncio.gather(*(self._adjust_budget_batch([adset], adjust_amount) for adset in adsets))
+            return [result for batch_result in retried for result in batch_result]
+
+        return [
+            {
+                "adset_id": adset["adset_id"],
+                "campaign_id": adset["campaign_id"],
+                "before": adset["amount"],
+                "after": adjust_amount,
+                "success": bool(response.get("success")),
+                "message": response.get("message"),
+            }
+            for adset in adsets
+        ]
     
+    async def _resolve_names(self, target, ids):
+        """ID -> 이름 반환 {str(ID): 이름}"""
+        ids = {entity_id for entity_id in ids if entity_id is not None}
+        entities = await self.entity_cache.get_or_refresh(
+            target, ids, lambda missing: self._refresh_structure(target, missing)
+        )
+
+        unknown = {str(entity_id) for entity_id in ids} - entities.keys()
+        if unknown:
+            logger.warning(f"GFA {target} 이름 조회 실패 {len(unknown)}건: {sorted(unknown)[:10]}")
+
+        return {entity_id: entity["name"] for entity_id, entity in entities.items()}
+
+    async def _refresh_structure(self, target, missing):
+        """캐시에 없는 항목 조회 (적으면 단건 조회, 많으면 전체 목록 조회)"""
+        if len(missing) > GFA_TARGETED_LOOKUP_LIMIT:
+            structure_list = await self.get_ad_structure_list(target)
+            return {structure["no"]: {"name": structure["name"]} for structure in structure_list}
+
+        async def fetch(no):
+            async with self.limiter:
+                return await self.client.get_structure(self.STRUCTURE_URIS[target], no)
+
+        missing = list(missing)
+        responses = await asyncio.gather(*(fetch(no) for no in missing))
+
+        return {
+            no: {"name": response["name"]}
+            for no, response in zip(missing, responses)
+            if response.get("status") != "error" and "name" in response
+        }
+
     async def get_ad_structure_list(self, target, activated: Any = None):
         """ 캠페인, 광고그룹, 소재 목록 반환"""
         # On / All 상태인 데이터 식별 하도록 추가
         # Client 코드 변경
-        structure_list = []
         api_list = {"campaigns": self.client.get_campaigns, 
                     "adsets": self.client.get_adsets,
                     "creatives": self.client.get_creatives}
 
-        response = await api_list[target]() if activated is None else await api_list[target](activated=activated)
-        
-        structure_list.extend(response.get("content", []))
+        async def fetch_page(page: int):
+            async with self.limiter:
+                return await api_list[target](page, activated=activated)
+
+        # 첫 페이지로 전체 페이지 수 확인 후 나머지 페이지 동시 조회 (모든 페이지에 activated 조건 적용)
+        response = await fetch_page(0)
         total_page = int(response.get("totalPages", 1))
-        
-        for page in range(1, total_page):
-            await asyncio.sleep(0.5)
-            response = await api_list[target](page)
+        responses = [response]
+
+        if total_page > 1:
+            responses += await asyncio.gather(*(fetch_page(page) for page in range(1, total_page)))
+
+        # 요청마다 재시도 후에도 실패한 페이지가 있으면 일부 목록만 반환하지 않고 실패 처리
+        failed = {page: response for page, response in enumerate(responses) if response.get("status") == "error"}
+        if failed:
+            page, response = next(iter(failed.items()))
+            raise Exception(f"GFA {target} 목록 조회 실패 ({len(failed)}/{len(responses)} 페이지, page {page}): {response.get('message')}")
+
+        structure_list = []
+        for response in responses:
             structure_list.extend(response.get("content", []))
-        
+
         return structure_list
-    
\ No newline at end of file
@@ -0,0 +1,281 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from database.job_store import job_store
+import asyncio, logging, os, time, uuid
+
+logger = logging.getLogger(__name__)
+
+# 단계 진행 이벤트를 저장소에 반영하는 최소 간격(초) (상태 변경은 항상 저장)
+JOB_PERSIST_INTERVAL = float(os.getenv("JOB_PERSIST_INTERVAL", "10"))
+
+# 현재 실행 중인 작업 / 단계 경로 (백그라운드 태스크마다 독립적으로 유지)
+_current_job: ContextVar[Optional["Job"]] = ContextVar("current_job", default=None)
+_current_stage: ContextVar[str] = ContextVar("current_stage", default="")
+
+
+class Job:
+    """백그라운드 수집 작업 상태"""
+
+    def __init__(self, name: str, params: Optional[Dict[str, Any]] = None):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.params = params or {}
+        self.status = "pending"
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.stages: List[Dict[str, Any]] = []
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.events: List[Dict[str, Any]] = []
+        self.task: Optional[asyncio.Task] = None
+        self._condition = asyncio.Condition()
+        self._persisted_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "partial", "failed", "cancelled")
+
+    async def publish(self, event: str, data: Dict[str, Any]):
+        """진행 이벤트 기록 후 구독자에게 알림"""
+        self.events.append({"event": event, "data": data, "time": datetime.now().isoformat()})
+        async with self._condition:
+            self._condition.notify_all()
+
+        await self._persist(force=event == "status")
+
+    async def _persist(self, force: bool = False):
+        """
+        다른 인스턴스에서도 조회할 수 있도록 상태 저장
+        상태 변경(시작 / 종료)은 항상, 단계 이벤트는 JOB_PERSIST_INTERVAL 간격으로만 저장
+        """
+        now = time.monotonic()
+        if not force and self._persisted_at is not None and now - self._persisted_at < JOB_PERSIST_INTERVAL:
+            return
+
+        self._persisted_at = now
+        await job_store.save(self.to_dict(include_result=self.done))
+
+    async def subscribe(self) -> AsyncIterator[Dict[str, Any]]:
+        """지난 이벤트부터 작업 종료까지 진행 이벤트 반환"""
+        index = 0
+        while True:
+            while index < len(self.events):
+                yield self.events[index]
+                index += 1
+
+            if self.done:
+                break
+
+            async with self._condition:
+                await self._condition.wait_for(lambda: len(self.events) > index or self.done)
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "name": self.name,
+            "params": self.params,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "stages": self.stages,
+            "error": self.error,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """
+    백그라운드 수집 작업 매니저
+    요청 즉시 작업 ID를 반환하고, 작업은 이벤트 루프의 별도 태스크로 실행
+    작업 상태는 JobStore(MongoDB)에도 저장되어 다른 인스턴스에서도 조회 가능
+
+    응답(202) 이후에도 태스크가 계속 실행되어야 하므로 Cloud Run은 CPU 항상 할당
+    (--no-cpu-throttling)으로 배포해야 함 (README 참고)
+    인스턴스 종료로 중단된 작업은 cancelled 상태로 저장되며 다시 요청해야 함
+    """
+
+    def __init__(self, max_finished_jobs: int = 200):
+        self._jobs: Dict[str, Job] = {}
+        self.max_finished_jobs = max_finished_jobs
+
+    def submit(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Job:
+        """작업 등록 후 백그라운드에서 실행"""
+        self._prune()
+        job = Job(name, params)
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job, func))
+        logger.info(f"작업 등록: {name} ({job.id})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    async def cancel(self, job_id: str) -> Optional[Job]:
+        """실행 중인 작업 취소"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+
+        if not job.done and job.task is not None:
+            job.task.cancel()
+            try:
+                await job.task
+            except asyncio.CancelledError:
+                pass
+
+        return job
+
+    async def _run(self, job: Job, func: Callable[[], Awaitable[Any]]):
+        _current_job.set(job)
+        job.status = "running"
+        job.started_at = datetime.now()
+        await job.publish("status", {"status": job.status})
+
+        try:
+            result = await func()
+            job.result = result
+
+            # 라우터 핸들러는 예외 대신 에러 응답 / 테이블별 False를 반환하므로 결과로 실패 판단
+            if isinstance(result, dict) and result.get("status") == "error":
+                job.status = "failed"
+                job.error = str(result.get("message"))
+            else:
+                succeeded, failed = _count_results(result)
+                if not failed:
+                    job.status = "succeeded"
+                else:
+                    job.status = "partial" if succeeded else "failed"
+                    job.error = f"적재 실패 {failed}건 (성공 {succeeded}건)"
+
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            logger.info(f"작업 취소: {job.name} ({job.id})")
+            raise
+
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.error(f"작업 실패: {job.name} ({job.id}) - {str(e)}")
+
+        finally:
+            job.finished_at = datetime.now()
+            await job.publish("status", {"status": job.status, "error": job.error})
+
+    def _prune(self):
+        """완료된 작업이 상한을 넘으면 오래된 순으로 정리"""
+        finished = [job for job in self._jobs.values() if job.done]
+        overflow = len(finished) - self.max_finished_jobs
+        if overflow <= 0:
+            return
+
+        finished.sort(key=lambda job: job.finished_at or job.created_at)
+        for job in finished[:overflow]:
+            del self._jobs[job.id]
+
+    async def shutdown(self):
+        """애플리케이션 종료 시 실행 중인 작업 취소 (중단 사유는 저장된 상태에 남음)"""
+        running = []
+        for job in self._jobs.values():
+            if job.task and not job.done:
+                job.error = "인스턴스 종료로 작업이 중단되었습니다. 다시 요청해 주세요."
+                job.task.cancel()
+                running.append(job.task)
+
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+            logger.info(f"실행 중이던 작업 {len(running)}건이 취소되었습니다.")
+
+
+def _count_results(result: Any) -> Tuple[int, int]:
+    """
+    핸들러 결과의 (성공, 실패) 건수
+    테이블별 적재 결과(True / False)와 매체별 에러 응답({"status": "error"})을 중첩 dict까지 집계
+    """
+    if result is True:
+        return 1, 0
+    if result is False:
+        return 0, 1
+    if not isinstance(result, dict):
+        return 0, 0
+    if result.get("status") == "error":
+        return 0, 1
+
+    succeeded = failed = 0
+    for value in result.values():
+        s, f = _count_results(value)
+        succeeded += s
+        failed += f
+    return succeeded, failed
+
+
+def count_rows(reports: Any) -> int:
+    """{테이블명: 데이터} 형태 리포트의 전체 행 수"""
+    if not isinstance(reports, dict):
+        return 0
+
+    total = 0
+    for data in reports.values():
+        if hasattr(data, "__len__") and not isinstance(data, (str, dict)):
+            total += len(data)
+    return total
+
+
+@asynccontextmanager
+async def job_stage(name: str):
+    """
+    작업 단계 시간 / 행 수 기록
+    작업 밖(일반 HTTP 요청)에서 호출되면 아무것도 기록하지 않음
+
+    사용 예:
+        async with job_stage("fetch") as stage:
+            response = await service.create_report()
+            stage["rows"] = count_rows(response)
+    """
+    job = _current_job.get()
+    parent = _current_stage.get()
+    path = f"{parent}/{name}" if parent else name
+    stage: Dict[str, Any] = {"name": path, "status": "running", "elapsed": None, "rows": None}
+
+    if job is None:
+        yield stage
+        return
+
+    token = _current_stage.set(path)
+    started = time.perf_counter()
+    job.stages.append(stage)
+    await job.publish("stage", dict(stage))
+
+    try:
+        yield stage
+        stage["status"] = "done"
+
+    except asyncio.CancelledError:
+        stage["status"] = "cancelled"
+        raise
+
+    except Exception:
+        stage["status"] = "failed"
+        raise
+
+    finally:
+        stage["elapsed"] = round(time.perf_counter() - started, 3)
+        _current_stage.reset(token)
+        await job.publish("stage", dict(stage))
+
+
+# 전역 인스턴스
+job_manager = JobManager()
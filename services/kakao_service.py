@@ -1,19 +1,61 @@
 from clients.kakao_api_client import KakaoAPIClient
+from database.entity_cache import EntityCache
+from utils.rate_limiter import get_adaptive_rate_limiter, get_rate_limiter
 import pandas as pd
-import asyncio, logging, time
+import asyncio, logging, os, time
 
 logger = logging.getLogger(__name__)
 
+# 키워드광고 API 요청 제한 (초당 요청 수 / 동시 요청 수)
+KAKAO_KEYWORD_RPS = float(os.getenv("KAKAO_KEYWORD_RPS", "5"))
+KAKAO_KEYWORD_CONCURRENCY = int(os.getenv("KAKAO_KEYWORD_CONCURRENCY", "5"))
+
+# 모먼트 리포트 API 광고 계정별 요청 한도 (5초에 1회)
+KAKAO_MOMENT_QUOTA_RPS = 0.2
+# 모먼트 리포트 API 요청 제한 (응답에 따라 초당 요청 수를 MIN ~ MAX 사이에서 조정, 한도를 넘지 않음)
+KAKAO_MOMENT_MAX_RPS = min(float(os.getenv("KAKAO_MOMENT_MAX_RPS", str(KAKAO_MOMENT_QUOTA_RPS))), KAKAO_MOMENT_QUOTA_RPS)
+KAKAO_MOMENT_RPS = min(float(os.getenv("KAKAO_MOMENT_RPS", str(KAKAO_MOMENT_MAX_RPS))), KAKAO_MOMENT_MAX_RPS)
+KAKAO_MOMENT_MIN_RPS = min(float(os.getenv("KAKAO_MOMENT_MIN_RPS", "0.05")), KAKAO_MOMENT_RPS)
+KAKAO_MOMENT_CONCURRENCY = int(os.getenv("KAKAO_MOMENT_CONCURRENCY", "1"))
+KAKAO_MOMENT_MAX_RETRIES = 5
+# 리포트 API 한 번에 조회 가능한 최대 소재 수 (요청 크기 초과 시에만 줄임)
+KAKAO_MOMENT_MAX_CHUNK = 100
+KAKAO_MOMENT_MIN_CHUNK = 10
+# 모먼트 캠페인 / 그룹 / 소재 목록 API 초당 요청 수
+KAKAO_MOMENT_INDEX_RPS = float(os.getenv("KAKAO_MOMENT_INDEX_RPS", "5"))
+
 class KakaoReportService:
+    KEYWORD_REPORT_COLUMNS = ["date", "campaignID", "groupID", "keywordID", "imp", "click", "cost", "rank"]
+
     def __init__(self, token, account_id):
         self.client = KakaoAPIClient(token, account_id)
+        self.keyword_limiter = get_rate_limiter(
+            "kakao_keyword", KAKAO_KEYWORD_RPS, burst=KAKAO_KEYWORD_CONCURRENCY,
+            max_concurrency=KAKAO_KEYWORD_CONCURRENCY,
+        )
+        # 모먼트 요청 한도는 광고 계정 단위
+        self.moment_limiter = get_adaptive_rate_limiter(
+            f"kakao_moment:{account_id}",
+            rate=KAKAO_MOMENT_RPS,
+            min_rate=KAKAO_MOMENT_MIN_RPS,
+            max_rate=KAKAO_MOMENT_MAX_RPS,
+            chunk_size=KAKAO_MOMENT_MAX_CHUNK,
+            min_chunk_size=KAKAO_MOMENT_MIN_CHUNK,
+            max_chunk_size=KAKAO_MOMENT_MAX_CHUNK,
+            max_concurrency=KAKAO_MOMENT_CONCURRENCY,
+        )
+        self.moment_index_limiter = get_rate_limiter(
+            f"kakao_moment_index:{account_id}", KAKAO_MOMENT_INDEX_RPS, burst=5, max_concurrency=5
+        )
+        self.entity_cache = EntityCache("kakao", account_id)
+        self.moment_cache = EntityCache("kakao_moment", account_id)
 
     # Kakao Keyword Report
     async def create_report(self):
         campaigns = await self.client.get_campaigns_info()
 
-        index_data = await self._create_report_index(campaigns)
         report_data = await self._load_report(campaigns)
+        index_data = await self._create_report_index(campaigns, report_data)
 
         merge_data = await self._merge_index(index_data, report_data)
 
@@ -23,78 +65,92 @@ class KakaoReportService:
         result = {"KAKAO_SEARCH": keyword_report}
         return result
 
-    async def _create_report_index(self, campaigns):
-        groups, keywords = {}, {}
+    async def _create_report_index(self, campaigns, report_data):
+        # 리포트에 있는 그룹 / 키워드만 캐시에서 조회, 캐시에 없는 항목은 해당 캠페인 / 그룹만 다시 탐색
+        group_campaigns = dict(zip(report_data["groupID"].astype(str), report_data["campaignID"]))
+        keyword_groups = dict(zip(report_data["keywordID"].astype(str), report_data["groupID"]))
+        crawled_keywords = {}
+
+        async def refresh_groups(missing):
+            # 캠페인 -> 그룹 -> 키워드 순으로 동시 탐색 (그룹 조회가 끝난 캠페인부터 키워드 조회 시작)
+            targets = {group_campaigns[group] for group in missing}
+            crawled = await asyncio.gather(*(self._crawl_campaign(campaign) for campaign in targets))
+            groups = {}
+
+            for campaign_group, group_keywords in crawled:
+                groups.update({group: {"name": name} for group, name in campaign_group.items()})
+                for group_keyword in group_keywords:
+                    crawled_keywords.update({keyword: {"name": name} for keyword, name in group_keyword.items()})
+
+            return groups
+
+        async def refresh_keywords(missing):
+            targets = {keyword_groups[keyword] for keyword in missing}
+            crawled = await asyncio.gather(*(self._crawl_group(group) for group in targets))
+            return {keyword: {"name": name} for group_keyword in crawled for keyword, name in group_keyword.items()}
+
+        groups = await self.entity_cache.get_or_refresh("groups", group_campaigns, refresh_groups)
+        # 그룹 탐색 중 함께 조회된 키워드 저장
+        await self.entity_cache.put_many("keywords", crawled_keywords)
+        keywords = await self.entity_cache.get_or_refresh("keywords", keyword_groups, refresh_keywords)
+
+        index_data = {
+            "campaigns": campaigns,
+            "groups": {group: entity["name"] for group, entity in groups.items()},
+            "keywords": {keyword: entity["name"] for keyword, entity in keywords.items()},
+        }
+        return index_data
 
-        for campaign in campaigns:
+    async def _crawl_campaign(self, campaign):
+        """캠페인의 그룹 목록 조회 후 그룹별 키워드 목록 동시 조회"""
+        async with self.keyword_limiter:
             campaign_group = await self.client.get_groups_info(campaign)
-            groups.update(campaign_group)
 
-        for group in groups:
-            group_keyword = await self.client.get_keywords_info(group)
-            keywords.update(group_keyword)
+        group_keywords = await asyncio.gather(
+            *(self._crawl_group(group) for group in campaign_group)
+        )
+        return campaign_group, group_keywords
 
-        index_data = {"campaigns": campaigns, "groups": groups, "keywords": keywords}
-        return index_data
+    async def _crawl_group(self, group):
+        async with self.keyword_limiter:
+            return await self.client.get_keywords_info(group)
 
     async def _load_report(self, campaigns):
-        report_data = pd.DataFrame(
-            columns=[
-                "date",
-                "campaignID",
-                "groupID",
-                "keywordID",
-                "imp",
-                "click",
-                "cost",
-                "rank",
-            ]
-        )
+        # 리포트 컬럼별 버퍼 {컬럼: 값 리스트} (캠페인 결과를 모두 모은 뒤 한 번에 DataFrame 생성)
+        buffers = {column: [] for column in self.KEYWORD_REPORT_COLUMNS}
 
-        for campaign in campaigns:
-            reports = await self.client.get_report(campaign)
-            campaign_result = await self._concat_data(reports)
-            report_data = pd.concat([report_data, campaign_result], ignore_index=True)
+        reports = await asyncio.gather(*(self._fetch_report(campaign) for campaign in campaigns))
 
-            await asyncio.sleep(1)
+        for campaign_report in reports:
+            self._append_report(buffers, campaign_report)
 
+        report_data = pd.DataFrame(buffers, columns=self.KEYWORD_REPORT_COLUMNS)
         return report_data
 
-    async def _concat_data(self, reports):
-        result = {}
+    async def _fetch_report(self, campaign):
+        async with self.keyword_limiter:
+            return await self.client.get_report(campaign)
 
-        for index, report in enumerate(reports["data"]):
-            date = report["start"]
+    def _append_report(self, buffers, reports):
+        """캠페인 리포트 응답을 컬럼별 버퍼에 추가"""
+        for report in reports["data"]:
+            dimensions, metrics = report["dimensions"], report["metrics"]
 
-            campaign = report["dimensions"]["campaignId"]
-            group = report["dimensions"]["adGroupId"]
-            keyword = report["dimensions"]["keywordId"]
-
-            imp = report["metrics"]["imp"]
-            click = report["metrics"]["click"]
-            cost = report["metrics"]["spending"]
-            rank = report["metrics"]["rank"]
-
-            result[index] = {
-                "date": date,
-                "campaignID": campaign,
-                "groupID": group,
-                "keywordID": keyword,
-                "imp": imp,
-                "click": click,
-                "cost": cost,
-                "rank": rank,
-            }
-
-        campaign_result = pd.DataFrame.from_dict(result, orient="index")
-        return campaign_result
+            buffers["date"].append(report["start"])
+            buffers["campaignID"].append(dimensions["campaignId"])
+            buffers["groupID"].append(dimensions["adGroupId"])
+            buffers["keywordID"].append(dimensions["keywordId"])
+            buffers["imp"].append(metrics["imp"])
+            buffers["click"].append(metrics["click"])
+            buffers["cost"].append(metrics["spending"])
+            buffers["rank"].append(metrics["rank"])
 
     async def _merge_index(self, index_data, report_data):
         report_data["campaignName"] = report_data["campaignID"].map(
             index_data["campaigns"]
         )
-        report_data["groupName"] = report_data["groupID"].map(index_data["groups"])
-        report_data["keywordName"] = report_data["keywordID"].map(
+        report_data["groupName"] = report_data["groupID"].astype(str).map(index_data["groups"])
+        report_data["keywordName"] = report_data["keywordID"].astype(str).map(
             index_data["keywords"]
         )
 
@@ -124,32 +180,125 @@ class KakaoReportService:
         groups = {"name": {}, "campaign": {}}
         creatives = {"name": {}, "group": {}}
 
-        for campaign in campagins:
-            campaign_group = await self.client.get_moment_groups_info(campaign)
-            groups["name"].update(campaign_group["name"])
-            groups["campaign"].update(campaign_group["campaign"])
+        # 소재 목록은 리포트 요청 대상이므로 항상 새로 조회 (새로 추가된 그룹 / 소재 누락 방지)
+        # 캐시에는 마지막으로 조회된 ID -> 이름 매핑만 저장 (바뀐 항목만 기록), 목록 조회에 실패한 캠페인 / 그룹만 캐시로 대체
+        async def fetch(request, target):
+            async with self.moment_index_limiter:
+                return await request(target)
+
+        async def list_children(request, entity_type, parent_key, parents):
+            parents = list(parents)
+            responses = await asyncio.gather(*(fetch(request, p) for p in parents), return_exceptions=True)
+            cached = await self.moment_cache.get_many(entity_type, include_stale=True)
+
+            failed = [p for p, response in zip(parents, responses) if isinstance(response, BaseException)]
+            children = [response for response in responses if not isinstance(response, BaseException)]
+            if failed:
+                children.append(self._cached_moment_children(entity_type, parent_key, failed, responses, cached))
+
+            index = {"name": {}, "parent": {}}
+            for child in children:
+                index["name"].update(child["name"])
+                index["parent"].update(child[parent_key])
+
+            mappings = {
+                str(entity_id): {"name": name, "parent": str(index["parent"][entity_id])}
+                for entity_id, name in index["name"].items()
+            }
+            changed = {entity_id: data for entity_id, data in mappings.items() if cached.get(entity_id) != data}
+            if changed:
+                logger.info(f"모먼트 {entity_type} 매핑 {len(changed)}건 갱신")
+                await self.moment_cache.put_many(entity_type, changed)
+            return index
+
+        group_index = await list_children(self.client.get_moment_groups_info, "group", "campaign", campagins)
+        groups["name"], groups["campaign"] = group_index["name"], group_index["parent"]
 
-        for group in groups["name"]:
-            group_creative = await self.client.get_moment_creatives_info(group)
-            creatives["name"].update(group_creative["name"])
-            creatives["group"].update(group_creative["group"])
+        creative_index = await list_children(self.client.get_moment_creatives_info, "creative", "group", groups["name"])
+        creatives["name"], creatives["group"] = creative_index["name"], creative_index["parent"]
 
         index_data = {"campaigns": campagins, "groups": groups, "creatives": creatives}
         return index_data
 
+    def _cached_moment_children(self, entity_type, parent_key, parents, responses, cached):
+        """
+        목록 조회에 실패한 상위 항목의 하위 항목을 마지막으로 저장된 매핑으로 대체 (캐시에도 없으면 실패)
+        저장 이후 추가 / 삭제된 하위 항목은 반영되지 않은 오래된 매핑일 수 있음
+        """
+        parents = {str(parent) for parent in parents}
+        children = {"name": {}, parent_key: {}}
+
+        for entity_id, data in cached.items():
+            if data.get("parent") in parents:
+                children["name"][entity_id] = data["name"]
+                children[parent_key][entity_id] = data["parent"]
+
+        found = set(children[parent_key].values())
+        if found != parents:
+            raise next(response for response in responses if isinstance(response, BaseException))
+
+        logger.warning(
+            f"모먼트 {entity_type} 목록 조회 실패 {len(parents)}건, 마지막으로 저장된 매핑 사용 "
+            f"(이후 추가 / 삭제된 {entity_type}는 반영되지 않을 수 있음)"
+        )
+        return children
+
     async def _create_moment_report(self, creatives_list):
+        # 시작 위치별 청크 결과 (청크 크기는 요청 시점의 limiter 값으로 결정)
+        chunk_results = {}
+        retry_queue = []
+        cursor = 0
+
+        def next_chunk():
+            nonlocal cursor
+            if retry_queue:
+                return retry_queue.pop(0)
+            if cursor >= len(creatives_list):
+                return None
+
+            start = cursor
+            cursor += self.moment_limiter.chunk_size
+            return start, creatives_list[start:cursor], 0
+
+        async def worker():
+            while True:
+                task = next_chunk()
+                if task is None:
+                    return
+
+                start, chunk, attempt = task
+                creatives_ids = ",".join(map(str, chunk))
+
+                async with self.moment_limiter:
+                    response = await self.client.request_moment_report(creatives_ids)
+
+                if self.moment_limiter.on_response(response):
+                    if attempt + 1 >= KAKAO_MOMENT_MAX_RETRIES:
+                        response.raise_for_status()
+
+                    # 요청 한도는 호출 횟수 기준이므로 같은 청크를 그대로 재요청 (limiter가 대기 시간 조정)
+                    retry_queue.append((start, chunk, attempt + 1))
+                    continue
+
+                # 요청 본문 / URL 길이 초과 시에만 줄어든 청크 크기로 나누어 재요청
+                if response.status_code in (413, 414) and len(chunk) > KAKAO_MOMENT_MIN_CHUNK:
+                    # 이미 줄어든 크기보다 큰 청크(줄이기 전 요청)는 현재 크기로만 나눔
+                    size = self.moment_limiter.chunk_size
+                    if len(chunk) <= size:
+                        size = min(self.moment_limiter.shrink_chunk(), len(chunk) // 2)
+                    for i in range(0, len(chunk), size):
+                        retry_queue.append((start + i, chunk[i : i + size], attempt))
+                    continue
+
+                response.raise_for_status()
+                chunk_results[start] = response.json()["data"]
+
+        await asyncio.gather(*(worker() for _ in range(KAKAO_MOMENT_CONCURRENCY)))
+
+        # 전체 리포트 데이터 (소재 순서 유지)
         creatives_report = []
-
-        # 전체 리포트 데이터 호출
-        for i in range(0, len(creatives_list), 100):
-            chunk = creatives_list[i : i + 100]
-            creatives_ids = ",".join(map(str, chunk))
-
-            chunk_response = await self.client.get_moment_report(creatives_ids)
-            creatives_report += chunk_response
-
-            if i + 100 < len(creatives_list):
-                await asyncio.sleep(5.3)
+        for start in sorted(chunk_results):
+            creatives_report += chunk_results[start]
 
         return creatives_report
 
@@ -0,0 +1,79 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import re
+
+
+class MetaRowTransformer:
+    """
+    Meta 인사이트 행 변환기 (필드 목록별로 한 번만 구성)
+
+    필드 지정 방식
+    - "impressions"                : 값 그대로
+    - "date_start"                 : date 컬럼
+    - "video_play_actions"         : video_view 값 -> video_views 컬럼 (기존 방식 유지)
+    - "actions:purchase"           : actions 배열의 purchase 값 -> actions_purchase 컬럼
+    - "action_values:purchase"     : action_values 배열의 purchase 값 -> action_values_purchase 컬럼
+    """
+
+    MISSING = "0"
+
+    # 이름이 고정된 컬럼 {API 필드: (컬럼명, action_type)}
+    RENAMED_FIELDS = {
+        "date_start": ("date", None),
+        "video_play_actions": ("video_views", "video_view"),
+    }
+
+    def __init__(self, fields: List[str]):
+        # (컬럼명, API 필드, action_type) - action_type이 None이면 값 그대로 사용
+        self.plan: List[Tuple[str, str, Optional[str]]] = []
+        self.api_fields: List[str] = []
+
+        for field in fields:
+            if ":" in field:
+                source, action_type = field.split(":", 1)
+                column = f"{source}_{re.sub(r'[^0-9a-zA-Z_]', '_', action_type)}"
+            elif field in self.RENAMED_FIELDS:
+                source = field
+                column, action_type = self.RENAMED_FIELDS[field]
+            else:
+                source, column, action_type = field, field, None
+
+            self.plan.append((column, source, action_type))
+            if source not in self.api_fields:
+                self.api_fields.append(source)
+
+    def transform_row(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """인사이트 행 하나 변환"""
+        row = {}
+        for column, source, action_type in self.plan:
+            if action_type is None:
+                row[column] = item.get(source)
+            else:
+                row[column] = self._extract_action_value(item.get(source), action_type)
+        return row
+
+    @classmethod
+    def _extract_action_value(cls, actions: Any, action_type: str) -> Any:
+        """[{action_type, value}, ...] 에서 action_type 값 추출 (같은 action_type이 여러 개면 첫 항목 사용)"""
+        if not actions or not isinstance(actions, list):
+            return cls.MISSING
+
+        for action in actions:
+            if isinstance(action, dict) and action.get("action_type") == action_type:
+                return action.get("value", cls.MISSING)
+
+        return cls.MISSING
+
+    def transform(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """인사이트 행 목록 변환"""
+        return [self.transform_row(item) for item in items]
+
+
+@lru_cache(maxsize=32)
+def _cached_transformer(fields: Tuple[str, ...]) -> MetaRowTransformer:
+    return MetaRowTransformer(list(fields))
+
+
+def get_row_transformer(fields: List[str]) -> MetaRowTransformer:
+    """필드 목록별 변환기 반환 (같은 필드 목록은 재사용)"""
+    return _cached_transformer(tuple(fields))
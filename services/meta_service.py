@@ -1,53 +1,74 @@
 from clients.meta_ads_api_client import MetaAdsAPIClient
-import logging
+from services.meta_row_transformer import get_row_transformer
+from datetime import datetime
+import asyncio, logging, os
 
 logger = logging.getLogger(__name__)
 
+# 예상 행 수(광고 수 x 일수)가 이 값 이상이면 비동기 리포트 작업 사용
+META_ASYNC_ROW_THRESHOLD = int(os.getenv("META_ASYNC_ROW_THRESHOLD", "5000"))
+# 일별 행 수가 이 일수 미만이면 광고 수를 조회하지 않고 동기 조회 (매일 실행되는 어제 리포트 등)
+META_ASYNC_MIN_DAYS = int(os.getenv("META_ASYNC_MIN_DAYS", "2"))
+
 
 class MetaAdsReportServices:
     def __init__(self, meat_client: MetaAdsAPIClient):
         self.client = meat_client
 
-    async def create_reports(self, fields):
-        # 리포트 생성
+    async def create_reports(self, fields, start_date=None, end_date=None, time_increment=None, raise_errors=False):
+        # 리포트 생성 (time_increment=1 이면 기간 내 일별 행)
+        # raise_errors=True 이면 조회 실패를 빈 결과 대신 예외로 전달 (백필 등 실패 여부가 중요한 경우)
         try:
-            items = await self.client.get_adset_performance(fields)
+            # "actions:purchase" 등 컬럼 지정은 API 필드(actions)로 변환하여 요청
+            api_fields = get_row_transformer(fields).api_fields
+
+            if await self._use_async_report(start_date, end_date, time_increment):
+                items = await self.client.get_adset_performance_async(api_fields, start_date, end_date, time_increment)
+            else:
+                items = await self.client.get_adset_performance(api_fields, start_date, end_date, time_increment)
+
             processing_data = await self._processing_report(items, fields)
             result = {"META": processing_data}
             return result
 
         except Exception as e:
+            if raise_errors:
+                logger.error(f"Meta 리포트 조회 실패 ({self.client.account_id}): {e}")
+                raise
             logger.info(e)
             return {"META": []}
 
-    async def _check_account_auth(self):
-        response = await self.client.verify_account_in_list()
-        return response
+    async def _use_async_report(self, start_date=None, end_date=None, time_increment=None):
+        """예상 행 수로 비동기 리포트 작업 사용 여부 결정 (일수가 적으면 광고 수 조회 생략)"""
+        # 일별 행(time_increment)일 때만 기간 일수만큼 행 수가 늘어남
+        days = 1
+        if start_date and end_date and time_increment:
+            days = (datetime.strptime(end_date, "%Y-%m-%d") - datetime.strptime(start_date, "%Y-%m-%d")).days + 1
 
-    def _extract_action_value(self, actions, action_type):
-        if not actions or not isinstance(actions, list):
-            return "0"
+        if days < META_ASYNC_MIN_DAYS:
+            return False
 
-        for action in actions:
-            if action.get("action_type") == action_type:
-                return action.get("value", "0")
+        try:
+            ads_count = await self.client.get_ads_count()
+        except Exception as e:
+            logger.warning(f"Meta 광고 수 조회 실패, 동기 조회 사용: {e}")
+            return False
+
+        expected_rows = ads_count * days
+        logger.info(f"Meta 예상 행 수: {expected_rows} (광고 {ads_count}개 x {days}일)")
+        return expected_rows >= META_ASYNC_ROW_THRESHOLD
+
+    async def get_account_overview(self):
+        """계정 권한 확인과 캠페인 목표 조회를 함께 실행 (배치 사용 시 한 번의 요청으로 전송)"""
+        verified, goals = await asyncio.gather(
+            self.client.verify_account_in_list(), self.client.get_optimization_goals()
+        )
+        return {"account_id": self.client.account_id, "verified": verified, "goals": goals}
 
-        return "0"
+    async def _check_account_auth(self):
+        response = await self.client.verify_account_in_list()
+        return response
 
     async def _processing_report(self, items, fields):
-        result = []
-        for item in items:
-            row = {}
-            for field in fields:
-                if field == "date_start":
-                    row["date"] = item.get(field)
-                elif field == "video_play_actions":
-                    # video_play_actions에서 video_view 값 추출
-                    row["video_views"] = self._extract_action_value(
-                        item.get(field), "video_view"
-                    )
-                else:
-                    row[field] = item.get(field)
-
-            result.append(row)
-        return result
+        # 필드 목록별 변환기로 행 변환 ("actions:purchase" 등 action_type 값 추출 포함)
+        return get_row_transformer(fields).transform(items)
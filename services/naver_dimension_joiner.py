@@ -0,0 +1,72 @@
+from configs.naver_config import naver_master_config
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class NaverDimensionJoiner:
+    """
+    네이버 통계 리포트 ID -> 이름 조인 엔진
+    마스터별로 해시 인덱스(ID)와 이름 배열을 한 번만 만들고,
+    통계 리포트의 이름 컬럼은 get_indexer 위치로 한 번에 take 하여 채움
+    """
+
+    MISSING = "-"
+
+    def __init__(self, masters: Dict[str, pd.DataFrame]):
+        self.lookups: Dict[str, Tuple[pd.Index, Dict[str, np.ndarray]]] = {}
+
+        for master_name, df in masters.items():
+            config_data = naver_master_config[master_name]
+            id_field, names = config_data["id"], config_data["name"]
+            names = names if isinstance(names, list) else [names]
+
+            # 이름이 없는 행 제외, 같은 ID는 마지막 값 사용 (get_indexer는 유일한 인덱스 필요)
+            filtered = df.dropna(subset=names).drop_duplicates(subset=[id_field], keep="last")
+            index = pd.Index(filtered[id_field])
+
+            # 매칭 실패 위치(-1)를 마지막 칸의 "-"로 보내기 위해 sentinel 추가
+            values = {}
+            for name in names:
+                column = filtered[name].to_numpy(dtype=object)
+                values[name] = np.append(column, self.MISSING)
+
+            self.lookups[master_name] = (index, values)
+            logger.info(f"{master_name} Index Complete ({len(index)}건)")
+
+    def resolve(self, report: pd.DataFrame, basics: List[str]) -> Dict[str, np.ndarray]:
+        """통계 리포트의 ID 컬럼으로 이름 컬럼 배열 생성 {이름 컬럼: 값 배열}"""
+        resolved = {}
+
+        for basic in basics:
+            index, values = self.lookups[basic]
+            id_field = naver_master_config[basic]["id"]
+
+            positions = index.get_indexer(report[id_field])
+            positions[positions < 0] = len(index)
+
+            for name, array in values.items():
+                resolved[name] = array.take(positions)
+
+        return resolved
+
+    def join(self, report: pd.DataFrame, basics: List[str], valid_header: List[str]) -> pd.DataFrame:
+        """이름 컬럼을 채운 결과를 valid_header 순서의 새 DataFrame으로 한 번에 구성"""
+        resolved = self.resolve(report, basics)
+
+        columns = {}
+        for field in valid_header:
+            if field in resolved:
+                columns[field] = resolved[field]
+                continue
+
+            series = report[field]
+            # 숫자 컬럼은 dtype 유지, 문자열 컬럼만 결측값을 "-"로 채움
+            if series.dtype == object and series.hasnans:
+                series = series.fillna(self.MISSING)
+            columns[field] = series.to_numpy()
+
+        return pd.DataFrame(columns, columns=valid_header, copy=False)
@@ -0,0 +1,138 @@
+from clients.naver_api_client import NaverAPIClient
+from utils.backoff import backoff_delays
+from typing import Dict, Iterator, Optional, Tuple
+import asyncio, logging
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingReport:
+    def __init__(self, uri: str, report_id: str, future: asyncio.Future, delays: Iterator[float], deadline: float):
+        self.uri = uri
+        self.report_id = report_id
+        self.future = future
+        self.delays = delays
+        self.deadline = deadline
+        self.next_poll = 0.0
+
+
+class NaverReportPoller:
+    """
+    네이버 리포트 작업 상태 폴러
+    /stat-reports, /master-reports 작업들을 하나의 루프에서 함께 조회하고
+    BUILT 상태가 되는 즉시 각 대기자에게 다운로드 URL을 전달
+    """
+
+    def __init__(
+        self,
+        naver_client: NaverAPIClient,
+        base_delay: float = 0.5,
+        max_delay: float = 5.0,
+        timeout: float = 180.0,
+    ):
+        self.client = naver_client
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+
+        self._pending: Dict[Tuple[str, str], _PendingReport] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait(self, uri: str, report_id: str) -> Optional[str]:
+        """리포트 완료까지 대기 후 다운로드 URL 반환 (데이터가 없는 리포트는 None)"""
+        loop = asyncio.get_running_loop()
+        pending = _PendingReport(
+            uri,
+            report_id,
+            loop.create_future(),
+            backoff_delays(self.base_delay, 1.5, self.max_delay),
+            loop.time() + self.timeout,
+        )
+        self._pending[(uri, report_id)] = pending
+        self._wakeup.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            return await pending.future
+        finally:
+            self._pending.pop((uri, report_id), None)
+
+    async def _run(self):
+        """대기 중인 리포트가 없어질 때까지 도래한 작업만 모아서 조회"""
+        loop = asyncio.get_running_loop()
+
+        try:
+            while self._pending:
+                self._wakeup.clear()
+                now = loop.time()
+
+                due = [p for p in self._pending.values() if p.next_poll <= now and not p.future.done()]
+                if due:
+                    # 한 작업의 실패가 다른 작업 조회를 멈추지 않도록 결과만 모음 (실패는 _poll에서 대기자에게 전달)
+                    await asyncio.gather(*(self._poll(p) for p in due), return_exceptions=True)
+
+                active = [p for p in self._pending.values() if not p.future.done()]
+                if not active:
+                    break
+
+                # 가장 빠른 다음 조회 시점까지 대기 (새 작업 등록 시 즉시 깨어남)
+                sleep_time = max(min(p.next_poll for p in active) - loop.time(), 0)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=sleep_time)
+                except asyncio.TimeoutError:
+                    pass
+
+        finally:
+            # 루프가 비정상 종료(취소 등)되면 남은 대기자가 멈추지 않도록 실패 처리
+            for pending in list(self._pending.values()):
+                if not pending.future.done():
+                    pending.future.set_exception(
+                        Exception(f"리포트 상태 조회 중단: {pending.uri}/{pending.report_id}")
+                    )
+
+    async def _poll(self, pending: _PendingReport):
+        """작업 하나 조회 (어떤 예외든 해당 대기자에게 전달하고 루프는 계속 진행)"""
+        try:
+            await self._check(pending)
+
+        except Exception as e:
+            logger.error(f"리포트 상태 처리 실패: {pending.uri}/{pending.report_id} - {str(e)}")
+            if not pending.future.done():
+                pending.future.set_exception(e)
+
+    async def _check(self, pending: _PendingReport):
+        loop = asyncio.get_running_loop()
+
+        try:
+            response = await self.client.get_report_status(pending.uri, pending.report_id)
+            status = response["status"]
+
+        except Exception as e:
+            logger.warning(f"리포트 상태 조회 실패: {pending.uri}/{pending.report_id} - {str(e)}")
+            status = None
+
+        if pending.future.done():
+            return
+
+        if status == "BUILT":
+            pending.future.set_result(response["downloadUrl"])
+
+        elif status == "NONE":
+            # 조회 조건에 해당하는 데이터가 없음
+            pending.future.set_result(None)
+
+        elif status == "ERROR":
+            pending.future.set_exception(
+                Exception(f"리포트 생성 실패: {pending.uri}/{pending.report_id}")
+            )
+
+        elif loop.time() >= pending.deadline:
+            pending.future.set_exception(
+                Exception(f"리포트 생성 시간 초과: {pending.uri}/{pending.report_id}")
+            )
+
+        else:
+            pending.next_poll = loop.time() + next(pending.delays)
@@ -1,163 +1,193 @@
 from clients.naver_api_client import NaverAPIClient
-from configs.naver_config import naver_field_master, naver_master_config, naver_vaild_fields
+from services.naver_report_poller import NaverReportPoller
+from services.naver_dimension_joiner import NaverDimensionJoiner
+from utils.date_format import format_report_date
+from database.naver_master_store import NaverMasterStore
+from configs.naver_config import naver_field_master, naver_vaild_fields
 from models.bigquery_schemas import naver_search_ad_schema, naver_search_ad_cov_schema, naver_shopping_ad_schema, naver_shopping_ad_cov_schema
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
 import os, io, csv
 import pandas as pd
-import time, datetime, logging
+import asyncio, logging
 
 logger = logging.getLogger(__name__)
 
+# API 키별 동시 리포트 작업 수
+NAVER_REPORT_CONCURRENCY = int(os.getenv("NAVER_REPORT_CONCURRENCY", "8"))
+
+# 변경분 요청 시 직전 동기화 시각보다 앞당겨 요청하는 여유 시간 (생성 중 변경 누락 방지)
+NAVER_MASTER_SYNC_OVERLAP = timedelta(minutes=10)
+
 
 class NaverReportService:
     """네이버 리포트 관련 비즈니스 로직을 처리하는 서비스"""
 
+    # 같은 API 키를 쓰는 모든 서비스 인스턴스가 공유
+    _report_semaphores: Dict[str, asyncio.Semaphore] = {}
+
     def __init__(self, naver_client: NaverAPIClient):
         self.client = naver_client
-        self.service_dir = os.path.dirname(os.path.abspath(__file__))
-        self.download_dir = os.path.join(self.service_dir, "download")
-
-        os.makedirs(self.download_dir, exist_ok=True)
+        self.poller = NaverReportPoller(naver_client)
+        self.master_store = NaverMasterStore(naver_client.customer_id)
 
     async def create_complete_report(self, master_list: list, stat_types: list) -> dict:
         """완전한 네이버 리포트 생성 (마스터 + 통계 데이터)"""
-        file_list = []
-
-        try:
-            # 마스터 리포트 생성
-            for master in master_list:
-                file_path = await self._create_and_download_master_report(master)
-                file_list.append(file_path)
-                logger.info(f"{master} 정보 생성 완료")
+        # 마스터 / 통계 리포트를 한 번에 요청하고 완료되는 순서대로 다운로드
+        jobs = [self._get_master_report(master) for master in master_list]
+        jobs += [self._create_and_download_stat_report(stat_type) for stat_type in stat_types]
 
-            # 통계 리포트 생성
-            for stat_type in stat_types:
-                file_path = await self._create_and_download_stat_report(stat_type)
-                file_list.append(file_path)
-                logger.info(f"{stat_type} 정보 생성 완료")
+        frames = await self._gather_reports(jobs)
+        reports = dict(zip(master_list + stat_types, frames))
 
-            # 리포트 병합
-            result = self._merge_reports(file_list, master_list, stat_types)
+        # 리포트 병합
+        result = self._merge_reports(reports, master_list, stat_types)
 
-            return result
+        return result
 
-        finally:
-            # 임시 파일 정리
-            self._cleanup_files(file_list)
+    async def _gather_reports(self, jobs: list) -> list:
+        """리포트 작업 동시 실행, 모든 작업이 끝난 뒤 실패한 작업이 있으면 예외 발생"""
+        responses = await asyncio.gather(*jobs, return_exceptions=True)
+
+        for response in responses:
+            if isinstance(response, BaseException):
+                raise response
+
+        return responses
+
+    def _get_report_semaphore(self) -> asyncio.Semaphore:
+        """API 키별 동시 리포트 작업 수 제한"""
+        api_key = self.client.api_key
+        if api_key not in self._report_semaphores:
+            self._report_semaphores[api_key] = asyncio.Semaphore(NAVER_REPORT_CONCURRENCY)
+        return self._report_semaphores[api_key]
+
+    async def _get_master_report(self, master_type: str) -> pd.DataFrame:
+        """마스터 저장소 기준 최신 마스터 데이터 반환 (변경분만 요청 후 병합)"""
+        async with self.master_store.lock(master_type):
+            info = await self.master_store.get_info(master_type)
+
+            snapshot = None
+            if not self.master_store.needs_full_refresh(info):
+                snapshot = await self.master_store.load(master_type)
+
+            synced_at = datetime.now(timezone.utc)
+
+            # 저장된 스냅샷이 없거나 재생성 주기가 지나면 전체 마스터 요청
+            if snapshot is None:
+                report = await self._create_and_download_master_report(master_type)
+                await self._save_master_snapshot(master_type, report, synced_at, True, info)
+                return report
+
+            from_time = self.master_store.get_last_sync(info) - NAVER_MASTER_SYNC_OVERLAP
+            delta = await self._create_and_download_master_report(master_type, from_time)
+            report = self.master_store.apply_delta(master_type, snapshot, delta)
+            await self._save_master_snapshot(master_type, report, synced_at, False, info)
+            return report
+
+    async def _save_master_snapshot(
+        self, master_type: str, report: pd.DataFrame, synced_at: datetime, full: bool, info: dict
+    ):
+        """저장 실패는 다음 실행에서 전체 마스터를 다시 받도록 경고만 남김"""
+        try:
+            await self.master_store.save(master_type, report, synced_at, full, info)
+        except Exception as e:
+            logger.warning(f"{master_type} 마스터 스냅샷 저장 실패: {e}")
 
-    async def _create_and_download_master_report(self, master_type: str) -> str:
+    async def _create_and_download_master_report(
+        self, master_type: str, from_time: Optional[datetime] = None
+    ) -> pd.DataFrame:
         """마스터 리포트 생성 및 다운로드"""
-        # 1. 리포트 생성 요청
-        report_id = await self.client.create_master_report(master_type)
+        async with self._get_report_semaphore():
+            # 1. 리포트 생성 요청
+            report_id = await self.client.create_master_report(master_type, from_time)
 
-        # 2. 완료될 때까지 대기
-        download_url = await self._wait_for_report_completion(
-            "/master-reports", report_id
-        )
+            # 2. 완료 대기 / 다운로드 / 서버에서 리포트 삭제
+            report = await self._download_report("/master-reports", report_id, master_type)
 
-        # 3. 리포트 다운로드 URL 요청
-        url_request = await self.client.request_download_url(download_url)
+        logger.info(f"{master_type} 정보 생성 완료")
+        return report
 
-        # 4. URL로 다운로드 진행
-        file_path = await self._file_download(url_request, master_type)
-
-        # 5. 서버에서 리포트 삭제
-        await self.client.delete_report("/master-reports", report_id)
-
-        return file_path
-
-    async def _create_and_download_stat_report(self, stat_type: str) -> str:
+    async def _create_and_download_stat_report(self, stat_type: str) -> pd.DataFrame:
         """통계 리포트 생성 및 다운로드"""
-        # 1. 리포트 생성 요청
-        report_id = await self.client.create_stat_report(stat_type)
-
-        # 2. 완료될 때까지 대기
-        download_url = await self._wait_for_report_completion(
-            "/stat-reports", report_id
-        )
+        async with self._get_report_semaphore():
+            # 1. 리포트 생성 요청
+            report_id = await self.client.create_stat_report(stat_type)
 
-        # 3. 리포트 다운로드 URL 요청
-        url_request = await self.client.request_download_url(download_url)
+            # 2. 완료 대기 / 다운로드 / 서버에서 리포트 삭제
+            report = await self._download_report("/stat-reports", report_id, stat_type)
 
-        # 4. URL로 다운로드 진행
-        file_path = await self._file_download(url_request, stat_type)
+        logger.info(f"{stat_type} 정보 생성 완료")
+        return report
 
-        # 5. 서버에서 리포트 삭제
-        await self.client.delete_report("/stat-reports", report_id)
+    async def _download_report(self, uri: str, report_id: str, report_name: str) -> pd.DataFrame:
+        """리포트 완료 대기 후 다운로드, 성공 여부와 관계없이 서버에서 리포트 삭제"""
+        try:
+            # 1. 완료될 때까지 대기 (데이터가 없는 리포트는 빈 DataFrame)
+            download_url = await self._wait_for_report_completion(uri, report_id)
+            if download_url is None:
+                logger.warning(f"{report_name} 리포트 데이터가 없습니다: {uri}/{report_id}")
+                return pd.DataFrame(columns=naver_field_master[f"{report_name}_report"])
 
-        return file_path
+            # 2. 리포트 다운로드 URL 요청
+            url_request = await self.client.request_download_url(download_url)
 
-    async def _wait_for_report_completion(
-        self, uri: str, report_id: str, max_attempts: int = 60
-    ) -> str:
-        """리포트 완료까지 대기"""
-        for attempt in range(max_attempts):
-            download_url = await self.client.get_report_status(uri, report_id)
-            if download_url["status"] == "BUILT":
-                return download_url["downloadUrl"]
+            # 3. URL로 다운로드 진행
+            return await self._file_download(url_request, report_name)
 
-            time.sleep(0.7)
+        finally:
+            try:
+                await self.client.delete_report(uri, report_id)
+            except Exception as e:
+                logger.warning(f"리포트 삭제 실패: {uri}/{report_id}, 에러: {e}")
 
-        raise Exception(f"리포트 생성 시간 초과: {uri}/{report_id}")
+    async def _wait_for_report_completion(self, uri: str, report_id: str) -> Optional[str]:
+        """리포트 완료까지 대기 (이벤트 루프를 막지 않는 폴러 사용)"""
+        return await self.poller.wait(uri, report_id)
 
-    async def _file_download(self, url_request, file_name) -> str:
-        """다운로드 URL로 진행"""
+    async def _file_download(self, url_request, report_name) -> pd.DataFrame:
+        """다운로드한 TSV를 메모리에서 바로 DataFrame으로 변환 (헤더 없는 리포트)"""
         if url_request.status_code != 200:
             raise Exception(f"다운로드 실패: {url_request.status_code}")
 
-        # 파일 저장
-        tsv_data = url_request.content.decode("utf-8")
-        df = pd.read_csv(io.StringIO(tsv_data), delimiter="\t", quoting=csv.QUOTE_NONE)
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_name = f"{file_name}_report_{timestamp}.csv"
-        file_path = os.path.join(self.download_dir, file_name)
-
-        df.to_csv(file_path, index=False, encoding="utf-8")
+        header = naver_field_master[f"{report_name}_report"]
+        df = pd.read_csv(
+            io.BytesIO(url_request.content),
+            delimiter="\t",
+            quoting=csv.QUOTE_NONE,
+            header=None,
+            names=header,
+            encoding="utf-8",
+            low_memory=False,
+            index_col=False,
+        )
 
-        return file_path
+        return df
 
     async def get_master_data_only(self, master_list: list) -> dict:
         """마스터 리포트 데이터만 추출 (성과 데이터 조인 없음)"""
-        file_list = []
-        try:
-            results = {}
-            for master in master_list:
-                file_path = await self._create_and_download_master_report(master)
-                report_name = f"{master}_report"
-                header = naver_field_master[report_name]
-                
-                # CSV 읽기 및 간단한 정제
-                df = pd.read_csv(file_path, header=0, names=header, low_memory=False, index_col=False)
-                
-                # 정수형 변환이 필요한 필드 처리 (기이하게 읽히는 경우 방지)
-                for col in df.columns:
-                    if "ID" in col or "Id" in col:
-                        df[col] = df[col].astype(str)
-
-                results[f"NAVER_{master}_INDEX"] = df.to_dict("records")
-                file_list.append(file_path)
-                logger.info(f"{master} 마스터 데이터 추출 완료")
-                
-            return results
-        finally:
-            self._cleanup_files(file_list)
-
-    def _merge_reports(self, report_list: list, master_list: list, stat_types: list) -> dict:
-        """여러 리포트 파일을 병합하여 하나의 DataFrame으로 만들기"""
-        keys = master_list + stat_types
-        header_list = {}
-
-        # 마스터 리포트를 header_list 변수에 추가
-        for key in keys:
-            for report in report_list:
-                report_name = f"{key}_report"
-                if report_name in report:
-                    header_list[key] = naver_field_master[report_name]
-                    break
-        
-        logger.info(f"Master Report Field Define Complete")
+        # 마스터 리포트를 한 번에 요청하고 완료되는 순서대로 다운로드
+        jobs = [self._get_master_report(master) for master in master_list]
+        frames = await self._gather_reports(jobs)
+
+        results = {}
+        for master, df in zip(master_list, frames):
+            # 스냅샷에는 삭제된 항목도 유지되므로 내보낼 때만 제외
+            df = NaverMasterStore.drop_deleted(df)
+
+            # 정수형 변환이 필요한 필드 처리 (기이하게 읽히는 경우 방지)
+            for col in df.columns:
+                if "ID" in col or "Id" in col:
+                    df[col] = df[col].astype(str)
+
+            results[f"NAVER_{master}_INDEX"] = df.to_dict("records")
+            logger.info(f"{master} 마스터 데이터 추출 완료")
+
+        return results
 
-        # 각 파일을 DataFrame으로 읽기
-        data ={}
+    def _merge_reports(self, reports: Dict[str, pd.DataFrame], master_list: list, stat_types: list) -> dict:
+        """다운로드한 리포트들을 병합하여 통계 리포트에 이름 부여"""
+        data = {}
         
         # 스키마 매핑
         schema_map = {
@@ -167,10 +197,7 @@ class NaverReportService:
             'SHOPPINGKEYWORD_CONVERSION_DETAIL': naver_shopping_ad_cov_schema()
         }
         
-        for key, report in zip(keys, report_list):
-            df = pd.read_csv(report, header=None, names=header_list[key], 
-                           low_memory=False, index_col=False)
-            
+        for key, df in reports.items():
             # 해당 스키마의 INTEGER 필드 찾기
             if key in schema_map:
                 integer_fields = [k for k, v in schema_map[key].items() 
@@ -184,20 +211,8 @@ class NaverReportService:
             data[key] = df    
         logger.info(f"Report Load Complete")
 
-        # 마스터 데이터를 딕셔너리로 변환
-        master_dict = {}
-        
-        # naver_config.py 에서 id: name 데이터 불러오기
-        for master_name in master_list:
-            config_data = naver_master_config[master_name]
-            id, name = config_data["id"], config_data["name"]
-            
-            name = name if isinstance(name, list) else [name]
-            
-            filtered_data = data[master_name].dropna(subset=name)
-            master_dict[master_name] = filtered_data.set_index(id)[name]
-            logger.info(f"{master_name} Index Complete")
-
+        # 마스터별 ID -> 이름 조회 배열 생성 (naver_config.py 의 id: name 기준)
+        joiner = NaverDimensionJoiner({master_name: data[master_name] for master_name in master_list})
         logger.info(f"Index Data Craft Complete")
         
         # Stat 리포트와 Master 리포트 연결 - ID에 이름 부여
@@ -214,27 +229,10 @@ class NaverReportService:
             if "SHOPPING" in stat_type:
                 basics.append("ShoppingProduct")
 
-            for basic in basics:
-                config_data = naver_master_config[basic]
-                id, name = config_data["id"], config_data["name"]
-                # report[name] = report[id].map(master_dict[basic]).fillna("-")
-                report = pd.merge(report, master_dict[basic], on=id, how="left").fillna("-")
-                
-            report["date"] = pd.to_datetime(report["date"], format="%Y%m%d").dt.strftime("%Y-%m-%d")
-            
             valid_header = naver_vaild_fields[stat_type]
-            report = report[valid_header]
-            report = report.to_dict("records")
-            result[f"NAVER_{stat_type}"] = report
-            basics = ["Campaign", "Adgroup"] # basics 초기화
+            report = joiner.join(report, basics, valid_header)
+            report["date"] = format_report_date(report["date"])
 
-        return result
+            result[f"NAVER_{stat_type}"] = report.to_dict("records")
 
-    def _cleanup_files(self, file_list: list):
-        """임시 파일들 정리"""
-        for file_path in file_list:
-            if file_path and os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except Exception as e:
-                    print(f"파일 삭제 실패: {file_path}, 에러: {e}")
+        return result
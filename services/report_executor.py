@@ -0,0 +1,94 @@
+from typing import Any, Callable, Dict, List, Optional
+from services.job_manager import job_stage
+import asyncio, logging, os, time
+
+logger = logging.getLogger(__name__)
+
+# 매체별 동시 실행 상한 (같은 API 키 / 토큰을 공유하는 매체는 낮게 설정)
+DEFAULT_MEDIA_LIMITS = {
+    "naver": 2,
+    "gfa": 2,
+    "kakao": 1,
+    "kakao_moment": 1,
+    "google_ads": 2,
+    "ga4": 2,
+    "meta": 2,
+    "criteo": 1,
+    "tiktok": 2,
+}
+
+
+class ReportExecutor:
+    """고객사 x 매체 리포트 핸들러를 동시에 실행하는 실행기
+
+    전체 동시 실행 수와 매체별 동시 실행 수를 각각 세마포어로 제한합니다.
+    """
+
+    def __init__(
+        self,
+        media_config: Dict[str, Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        media_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.media_config = media_config
+        self.max_concurrency = max_concurrency or int(os.getenv("REPORT_MAX_CONCURRENCY", "8"))
+        self.media_limits = {**DEFAULT_MEDIA_LIMITS, **(media_limits or {})}
+
+        self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._media_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_media_semaphore(self, media: str) -> asyncio.Semaphore:
+        if media not in self._media_semaphores:
+            limit = self.media_limits.get(media, self.max_concurrency)
+            self._media_semaphores[media] = asyncio.Semaphore(limit)
+        return self._media_semaphores[media]
+
+    async def _run_handler(self, customer: str, media: str, handler: Callable, model_class):
+        """매체 세마포어 -> 전역 세마포어 순으로 획득 후 핸들러 실행"""
+        async with self._get_media_semaphore(media):
+            async with self._global_semaphore:
+                started = time.perf_counter()
+                try:
+                    request_model = model_class(customer=customer)
+                    async with job_stage(f"{customer}/{media}"):
+                        response = await handler(request_model)
+
+                except Exception as e:
+                    logger.error(f"{customer}/{media} 리포트 실패: {str(e)}")
+                    response = {"status": "error", "message": str(e)}
+
+                elapsed = round(time.perf_counter() - started, 3)
+                logger.info(f"{customer}/{media} 리포트 완료 ({elapsed}s)")
+                return customer, media, response, elapsed
+
+    async def run(self, customers: List[str], media_lists: Dict[str, List[str]]) -> Dict[str, Any]:
+        """전체 (고객사, 매체) 조합을 동시 실행하고 고객사/매체별 결과와 소요 시간 반환"""
+        started = time.perf_counter()
+        result: Dict[str, Dict[str, Any]] = {}
+        timing: Dict[str, Dict[str, float]] = {}
+        tasks = []
+
+        for customer in customers:
+            result[customer] = {}
+            timing[customer] = {}
+
+            for media in media_lists[customer]:
+                if media not in self.media_config:
+                    result[customer][media] = "지원하지 않는 매체입니다."
+                    continue
+
+                # 응답 순서와 무관하게 설정 순서대로 결과 키를 유지
+                result[customer][media] = None
+                config = self.media_config[media]
+                tasks.append(
+                    self._run_handler(customer, media, config["handler"], config["model_class"])
+                )
+
+        for customer, media, response, elapsed in await asyncio.gather(*tasks):
+            result[customer][media] = response
+            timing[customer][media] = elapsed
+
+        total_elapsed = round(time.perf_counter() - started, 3)
+        logger.info(f"전체 리포트 실행 완료: {len(tasks)}건, {total_elapsed}s")
+
+        return {"result": result, "timing": timing, "elapsed": total_elapsed}
@@ -1,56 +1,159 @@
 from clients.tiktok_api_client import TikTokAPIClient
+from models.bigquery_schemas import tiktok_schema
+from utils.rate_limiter import get_rate_limiter
+from utils.backoff import backoff_delays
 import pandas as pd
-import time, datetime, logging
+import asyncio, time, datetime, logging, os, tempfile
 
 logger = logging.getLogger(__name__)
 
+# TikTok 리포트 API 요청 제한 (초당 요청 수 / 동시 요청 수) 및 페이지별 재시도 횟수
+TIKTOK_QPS = float(os.getenv("TIKTOK_QPS", "10"))
+TIKTOK_CONCURRENCY = int(os.getenv("TIKTOK_CONCURRENCY", "5"))
+TIKTOK_PAGE_RETRIES = int(os.getenv("TIKTOK_PAGE_RETRIES", "3"))
+
+# 전체 행 수가 이 값 이상이면 비동기 리포트 작업 사용 / 작업 대기 시간(초)
+TIKTOK_ASYNC_ROW_THRESHOLD = int(os.getenv("TIKTOK_ASYNC_ROW_THRESHOLD", "50000"))
+TIKTOK_ASYNC_TIMEOUT = float(os.getenv("TIKTOK_ASYNC_TIMEOUT", "900"))
+# 다운로드 파일을 메모리에 보관할 최대 크기 (초과 시 임시 파일 사용)
+TIKTOK_DOWNLOAD_SPOOL_SIZE = 64 * 1024 * 1024
+# 숫자로 변환할 측정항목 (설정의 metrics에는 ID / 이름 같은 속성 컬럼도 포함되므로 스키마 기준)
+TIKTOK_NUMERIC_FIELDS = {field for field, field_type in tiktok_schema().items() if field_type in ("INTEGER", "FLOAT")}
+
 
 class TikTokReportService:
     def __init__(self, tiktok_client: TikTokAPIClient):
         self.client = tiktok_client
+        self.limiter = get_rate_limiter(
+            "tiktok", TIKTOK_QPS, burst=TIKTOK_CONCURRENCY, max_concurrency=TIKTOK_CONCURRENCY
+        )
 
     async def create_report(self, dimensions_list, metrics_list):
-        all_data = []
-        page = 1
         page_size = 1000  # 최대값 설정
 
-        while True:
-            response = await self.client.get_reports(page=page, page_size=page_size,
-                                                     dimensions_list=dimensions_list, metrics_list=metrics_list)
+        # 첫 페이지로 전체 페이지 수 확인 후 나머지 페이지 동시 조회
+        first_page = await self._fetch_page(1, page_size, dimensions_list, metrics_list)
+        page_info = first_page.get("page_info", {})
+        total_page = page_info.get("total_page", 1)
+        logger.info(f"Fetched page 1/{total_page}, records: {len(first_page.get('list', []))}")
 
-            # 에러 체크
-            if "error" in response or response.get("code") != 0:
-                logger.error(f"TikTok API error: {response}")
-                break
-
-            # 데이터 추출
-            data = response.get("data", {})
-            list_data = data.get("list", [])
-            page_info = data.get("page_info", {})
-
-            if list_data:
-                # dimensions와 metrics 합치기
-                flattened_data = []
-                for record in list_data:
-                    flat_record = {}
-                    # dimensions 추가
-                    if "dimensions" in record:
-                        flat_record.update(record["dimensions"])
-                    # metrics 추가
-                    if "metrics" in record:
-                        flat_record.update(record["metrics"])
-                    flat_record["date"] = flat_record.pop("stat_time_day")
-                    
-                    flattened_data.append(flat_record)
-
-                all_data.extend(flattened_data)
-                logger.info(f"Fetched page {page}/{page_info.get('total_page', 1)}, records: {len(list_data)}")
-
-            # 마지막 페이지 확인
-            if page >= page_info.get("total_page", 1):
-                break
-
-            page += 1
+        # 행 수가 많으면 비동기 리포트 작업으로 전환 (DataFrame 반환)
+        total_number = page_info.get("total_number", 0)
+        if total_number >= TIKTOK_ASYNC_ROW_THRESHOLD:
+            logger.info(f"TikTok 전체 {total_number}행, 비동기 리포트 작업 사용")
+            report = await self._create_async_report(dimensions_list, metrics_list)
+            return {"TIKTOK": report}
+
+        pages = [first_page]
+        if total_page > 1:
+            pages += await asyncio.gather(
+                *(self._fetch_page(page, page_size, dimensions_list, metrics_list) for page in range(2, total_page + 1))
+            )
+
+        # gather 결과는 페이지 번호 순서 그대로
+        all_data = []
+        for data in pages:
+            all_data.extend(self._flatten(data.get("list", [])))
 
         result = {"TIKTOK": all_data}
-        return result
\ No newline at end of file
+        return result
+
+    async def _fetch_page(self, page, page_size, dimensions_list, metrics_list):
+        """페이지 조회 (실패 시 백오프 후 재시도, 모두 실패하면 예외)"""
+        delays = backoff_delays(base=1.0, max_delay=10.0)
+
+        for attempt in range(1, TIKTOK_PAGE_RETRIES + 1):
+            async with self.limiter:
+                response = await self.client.get_reports(page=page, page_size=page_size,
+                                                         dimensions_list=dimensions_list, metrics_list=metrics_list)
+
+            # 에러 체크
+            if "error" not in response and response.get("code") == 0:
+                if page > 1:
+                    logger.info(f"Fetched page {page}, records: {len(response['data'].get('list', []))}")
+                return response.get("data", {})
+
+            logger.warning(f"TikTok API error (page {page}, {attempt}/{TIKTOK_PAGE_RETRIES}): {response}")
+            if attempt < TIKTOK_PAGE_RETRIES:
+                await asyncio.sleep(next(delays))
+
+        raise Exception(f"TikTok 리포트 {page} 페이지 조회 실패: {response}")
+
+    async def _create_async_report(self, dimensions_list, metrics_list) -> pd.DataFrame:
+        """비동기 리포트 작업 생성 -> 완료 대기 -> 결과 파일을 DataFrame으로 변환"""
+        response = await self.client.create_report_task(dimensions_list, metrics_list)
+        if "error" in response or response.get("code") != 0:
+            raise Exception(f"TikTok 리포트 작업 생성 실패: {response}")
+
+        task_id = response["data"]["task_id"]
+        logger.info(f"TikTok 리포트 작업 생성: {task_id}")
+        await self._wait_report_task(task_id)
+
+        with tempfile.SpooledTemporaryFile(max_size=TIKTOK_DOWNLOAD_SPOOL_SIZE) as file_obj:
+            await self.client.download_report_task(task_id, file_obj)
+            file_obj.seek(0)
+            # 차원(ID 등)은 문자열로 읽고, 빈 칸은 null로 유지
+            report = pd.read_csv(file_obj, dtype=str)
+
+        # 숫자 측정항목만 변환 (빈 칸 / 숫자가 아닌 값은 null, 정수 값만 있으면 정수형 유지)
+        # ID / 이름 등 속성 컬럼은 동기 API 결과처럼 문자열로 유지
+        for metric in metrics_list:
+            if metric in report.columns and metric in TIKTOK_NUMERIC_FIELDS:
+                report[metric] = self._to_numeric(report[metric])
+
+        # 동기 API 결과와 같은 컬럼 구성 (stat_time_day -> date, 마지막 컬럼)
+        if "stat_time_day" in report.columns:
+            report["date"] = report.pop("stat_time_day")
+
+        logger.info(f"TikTok 리포트 작업 다운로드 완료: {task_id}, records: {len(report)}")
+        return report
+
+    @staticmethod
+    def _to_numeric(values: pd.Series) -> pd.Series:
+        numbers = pd.to_numeric(values, errors="coerce")
+        valid = numbers.dropna()
+        if valid.empty or (valid == valid.round()).all():
+            return numbers.astype("Int64")
+        return numbers
+
+    async def _wait_report_task(self, task_id):
+        """리포트 작업 완료까지 상태 조회 (이벤트 루프를 막지 않고 대기)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + TIKTOK_ASYNC_TIMEOUT
+
+        for delay in backoff_delays(base=1.0, factor=1.5, max_delay=15.0):
+            async with self.limiter:
+                response = await self.client.check_report_task(task_id)
+
+            status = response.get("data", {}).get("status") if response.get("code") == 0 else None
+
+            if status == "SUCCESS":
+                return
+
+            if status in ("FAILED", "CANCELED"):
+                raise Exception(f"TikTok 리포트 작업 실패: {task_id} ({status})")
+
+            if status is None:
+                logger.warning(f"TikTok 리포트 작업 상태 조회 실패: {response}")
+
+            if loop.time() + delay > deadline:
+                raise Exception(f"TikTok 리포트 작업 시간 초과: {task_id}")
+
+            await asyncio.sleep(delay)
+
+    def _flatten(self, list_data):
+        # dimensions와 metrics 합치기
+        flattened_data = []
+        for record in list_data:
+            flat_record = {}
+            # dimensions 추가
+            if "dimensions" in record:
+                flat_record.update(record["dimensions"])
+            # metrics 추가
+            if "metrics" in record:
+                flat_record.update(record["metrics"])
+            flat_record["date"] = flat_record.pop("stat_time_day")
+
+            flattened_data.append(flat_record)
+
+        return flattened_data
@@ -0,0 +1,15 @@
+from typing import Iterator
+import random
+
+
+def backoff_delays(
+    base: float = 0.5, factor: float = 2.0, max_delay: float = 10.0, jitter: float = 0.5
+) -> Iterator[float]:
+    """
+    지수 백오프 대기 시간 생성기 (jitter 포함)
+    jitter 비율만큼 대기 시간을 무작위로 줄여 동시 요청이 같은 시점에 몰리지 않도록 함
+    """
+    delay = base
+    while True:
+        yield delay * (1 - jitter * random.random())
+        delay = min(delay * factor, max_delay)
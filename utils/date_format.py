@@ -0,0 +1,14 @@
+from typing import Union
+import numpy as np
+import pandas as pd
+
+
+def format_report_date(dates: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """YYYYMMDD -> YYYY-MM-DD 변환 (고유값만 변환 후 take)"""
+    codes, uniques = pd.factorize(dates)
+    formatted = pd.to_datetime(pd.Series(uniques).astype(str), format="%Y%m%d").dt.strftime("%Y-%m-%d")
+
+    # 결측 날짜(-1)는 마지막 칸의 None으로 보냄
+    formatted = np.append(formatted.to_numpy(dtype=object), None)
+    codes[codes < 0] = len(uniques)
+    return formatted.take(codes)
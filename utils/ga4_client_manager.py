@@ -0,0 +1,65 @@
+from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient
+import asyncio
+import logging
+from typing import Dict, Tuple
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class GA4AsyncClientManager:
+    """
+    GA4 비동기 클라이언트 매니저
+    gRPC aio 채널을 요청마다 만들지 않도록 서비스 계정별로 하나만 생성하여 재사용
+    채널은 생성한 이벤트 루프에서만 사용할 수 있으므로 (서비스 계정, 이벤트 루프) 단위로 관리
+    """
+    _instances: Dict[Tuple[str, int], BetaAnalyticsDataAsyncClient] = {}
+    _lock = asyncio.Lock()
+
+    @classmethod
+    async def get_client(cls, config: dict) -> BetaAnalyticsDataAsyncClient:
+        """설정 기반으로 GA4 비동기 클라이언트 반환 (동일한 설정이면 기존 클라이언트 재사용)"""
+        key = (cls._generate_config_key(config), id(asyncio.get_running_loop()))
+
+        if key not in cls._instances:
+            async with cls._lock:
+                if key not in cls._instances:
+                    cls._instances[key] = BetaAnalyticsDataAsyncClient.from_service_account_info(config)
+                    logger.info(f"새로운 GA4 비동기 클라이언트가 생성되었습니다. ({config.get('client_email')})")
+
+        return cls._instances[key]
+
+    @classmethod
+    def _generate_config_key(cls, config: dict) -> str:
+        """설정 기반으로 고유 키 생성"""
+        key_fields = {
+            'project_id': config.get('project_id'),
+            'client_email': config.get('client_email'),
+            'private_key_id': config.get('private_key_id')
+        }
+        return json.dumps(key_fields, sort_keys=True)
+
+    @classmethod
+    async def close_all(cls):
+        """현재 이벤트 루프에서 만든 GA4 비동기 클라이언트의 채널 정리"""
+        loop_id = id(asyncio.get_running_loop())
+
+        async with cls._lock:
+            for key in [key for key in cls._instances if key[1] == loop_id]:
+                try:
+                    await cls._instances.pop(key).transport.close()
+                except Exception as e:
+                    logger.warning(f"GA4 비동기 클라이언트 정리 중 오류: {e}")
+
+        logger.info("GA4 비동기 클라이언트가 정리되었습니다.")
+
+
+# 전역 함수들
+async def get_ga4_async_client(config: dict) -> BetaAnalyticsDataAsyncClient:
+    """전역 GA4 비동기 클라이언트 반환"""
+    return await GA4AsyncClientManager.get_client(config)
+
+
+async def cleanup_ga4_async_clients():
+    """GA4 비동기 클라이언트 정리"""
+    await GA4AsyncClientManager.close_all()
@@ -0,0 +1,175 @@
+from typing import Dict, Optional
+import asyncio, logging
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식 요청 속도 제한
+    초당 rate 회, 최대 burst 회까지 연속 요청 허용 (max_concurrency 지정 시 동시 요청 수도 제한)
+
+    사용 예:
+        async with limiter:
+            response = await client.get_report(...)
+    """
+
+    def __init__(self, rate: float, burst: int = 1, max_concurrency: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def acquire(self):
+        """토큰이 생길 때까지 대기 후 1개 사용"""
+        loop = asyncio.get_running_loop()
+
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated_at is not None:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+
+        try:
+            await self.acquire()
+        except BaseException:
+            if self._semaphore is not None:
+                self._semaphore.release()
+            raise
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    응답 피드백 기반 요청 속도 제한 (AIMD)
+    성공 시 요청 속도를 max_rate까지 조금씩 늘리고, 429 응답이나 남은 요청 수 부족 시 크게 줄임
+    Retry-After 헤더가 있으면 해당 시간 동안 모든 요청을 멈춤
+
+    요청 한도가 호출 횟수 기준이므로 429에는 청크 크기를 줄이지 않음 (청크를 나누면 호출만 늘어남)
+    청크 크기는 요청 본문 / URL 길이 초과(413, 414) 시에만 shrink_chunk로 줄임
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float,
+        max_rate: float,
+        chunk_size: int = 100,
+        min_chunk_size: int = 10,
+        max_chunk_size: int = 100,
+        max_concurrency: Optional[int] = None,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+    ):
+        super().__init__(rate, burst=1, max_concurrency=max_concurrency)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self._blocked_until = 0.0
+
+    async def acquire(self):
+        """Retry-After 대기 시간이 끝난 뒤 토큰 사용"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            wait = self._blocked_until - loop.time()
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+
+        await super().acquire()
+
+    def on_response(self, response) -> bool:
+        """
+        응답 결과를 반영하여 속도 / 청크 크기 조정
+        요청 제한(429)에 걸린 경우 True 반환 (같은 요청 재시도 필요)
+        """
+        headers = response.headers
+
+        if response.status_code == 429:
+            retry_after = self._parse_seconds(headers.get("Retry-After"))
+            self._decrease(retry_after if retry_after is not None else 1 / self.rate)
+            logger.warning(f"요청 제한 응답(429): 초당 {self.rate:.2f}회로 조정")
+            return True
+
+        remaining = self._parse_seconds(self._find_header(headers, "ratelimit-remaining"))
+        if remaining is not None and remaining <= 1:
+            # 남은 요청 수가 없으면 초기화 시점까지 대기
+            reset = self._parse_seconds(self._find_header(headers, "ratelimit-reset"))
+            self._decrease(reset if reset is not None else 1 / self.rate)
+            return False
+
+        if response.is_success:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+        return False
+
+    def shrink_chunk(self) -> int:
+        """요청 본문 / URL 길이 초과 시 청크 크기를 절반으로 줄임 (이후 요청에도 유지)"""
+        self.chunk_size = max(self.min_chunk_size, self.chunk_size // 2)
+        logger.warning(f"요청 크기 초과: 청크 {self.chunk_size}개로 조정")
+        return self.chunk_size
+
+    def _decrease(self, pause: float):
+        loop = asyncio.get_running_loop()
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._blocked_until = max(self._blocked_until, loop.time() + pause)
+
+    @staticmethod
+    def _find_header(headers, suffix: str) -> Optional[str]:
+        """X-RateLimit-Remaining, RateLimit-Remaining 등 접두사가 다른 헤더 검색"""
+        for key, value in headers.items():
+            if key.lower().endswith(suffix):
+                return value
+        return None
+
+    @staticmethod
+    def _parse_seconds(value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+
+# API별 전역 인스턴스 (같은 API를 호출하는 모든 서비스가 공유)
+_rate_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(
+    name: str, rate: float, burst: int = 1, max_concurrency: Optional[int] = None
+) -> RateLimiter:
+    """이름별 RateLimiter 반환 (없으면 생성)"""
+    if name not in _rate_limiters:
+        _rate_limiters[name] = RateLimiter(rate, burst, max_concurrency)
+        logger.info(f"{name} 요청 제한 생성: 초당 {rate}회 (burst {burst}, 동시 {max_concurrency})")
+    return _rate_limiters[name]
+
+
+def get_adaptive_rate_limiter(name: str, **kwargs) -> AdaptiveRateLimiter:
+    """이름별 AdaptiveRateLimiter 반환 (없으면 생성, 조정된 속도는 다음 요청에도 유지)"""
+    if name not in _rate_limiters:
+        _rate_limiters[name] = AdaptiveRateLimiter(**kwargs)
+        logger.info(f"{name} 적응형 요청 제한 생성: {kwargs}")
+    return _rate_limiters[name]